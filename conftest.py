@@ -0,0 +1,15 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Shared pytest fixtures
+"""
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(2026)
@@ -9,9 +9,33 @@
 """
 
 # *********** importing all the required library***********
+import math
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
+
+from rotation import euler_to_dcm
+
+# Maximum number of CompiledTransform objects kept by compile_transform
+TRANSFORM_CACHE_SIZE = 256
 # *********** Function for coordinate transform ***********
+def transformSequence(order):
+    """Function to get the sequence of the four matrices T, X, Y, Z multiplied for an order
+            Repeated characters count once and missing ones are appended in 'TXYZ' order, e.g. 'TXY' -> 'TXYZ', 'ZT' -> 'ZTXY'
+
+    Args:
+        order ([str]): [order of transformation and rotation]
+
+    Returns:
+        [str]: [permutation of 'TXYZ']
+    """
+    sequence = ''.join(dict.fromkeys(order + 'TXYZ'))[:4]
+    if sorted(sequence) != sorted('TXYZ'):
+        raise ValueError(f"Invalid order: {order!r}, expected the characters T, X, Y and Z (e.g. 'TXYZ')")
+    return sequence
+
+
 def orderMult(order, Tr, Rx, Ry, Rz, typ):
     """Function to perform multiplication in required order or sequence
 
@@ -26,16 +50,8 @@ def orderMult(order, Tr, Rx, Ry, Rz, typ):
     Returns:
         [matrix]: [Transformation matrix]
     """
-    MatDict = {char: ord(char) for char in order}
-    MatDict['T'] = Tr
-    MatDict['X'] = Rx
-    MatDict['Y'] = Ry
-    MatDict['Z'] = Rz
-    keys = list(MatDict.keys())
-    val1 = MatDict[keys[0]]
-    val2 = MatDict[keys[1]]
-    val3 = MatDict[keys[2]]
-    val4 = MatDict[keys[3]]
+    MatDict = {'T': Tr, 'X': Rx, 'Y': Ry, 'Z': Rz}
+    val1, val2, val3, val4 = (MatDict[key] for key in transformSequence(order))
 
     if typ == 1:
         RotMat = val4 @ val3 @ val2 @ val1
@@ -65,35 +81,154 @@ def coordinateTransform(order='TXYZ', Tra=[0, 0, 0], a_x=0, a_y=0, a_z=0, point=
         [List]: point coordinate after transformation
     """
 
-    Xc = np.matrix([[point[0]], [point[1]], [point[2]], [1]])
-    theta_x = np.deg2rad(a_x)
-    theta_y = np.deg2rad(a_y)
-    theta_z = np.deg2rad(a_z)
+    return compile_transform(order, Tra, a_x, a_y, a_z, typ).apply_point(point)
+
+
+def transformMatrix(order='TXYZ', Tra=[0, 0, 0], a_x=0, a_y=0, a_z=0, typ=1):
+    """Function to build the composed 4x4 homogeneous matrix used by coordinateTransform
+
+    Args:
+        order (str): [order of transformation and rotation]. Defaults to 'TXYZ'.
+        Tra (list):  [Translation of a coordinate or point]. Defaults to [0,0,0].
+        a_x (float):   [anti-clockwise rotation along the x-axis]. Defaults to 0.
+        a_y (float):   [anti-clockwise rotation along the y-axis]. Defaults to 0.
+        a_z (float):   [anti-clockwise rotation along the z-axis]. Defaults to 0.
+        typ (int, optional): [1 & 2 (1: for coordinate transformation, 2: for point transformation with fix coordinate)].Defaults to 1.
 
+    Returns:
+        [ndarray]: 4x4 transformation matrix
+    """
     if typ == 2:
-        tx = Tra[0]
-        ty = Tra[1]
-        tz = Tra[2]
+        sign = 1.0
     elif typ == 1:
-        tx = Tra[0] * -1
-        ty = Tra[1] * -1
-        tz = Tra[2] * -1
-        theta_x = np.deg2rad(a_x) * -1
-        theta_y = np.deg2rad(a_y) * -1
-        theta_z = np.deg2rad(a_z) * -1
+        sign = -1.0
     else:
-        print("Enter typ=1: for coordinate transformation & typ=2: for point transformation")
+        raise ValueError("Enter typ=1: for coordinate transformation & typ=2: for point transformation")
+    angles = {'X': sign*math.radians(a_x), 'Y': sign*math.radians(a_y), 'Z': sign*math.radians(a_z)}
+    translation = [sign*Tra[0], sign*Tra[1], sign*Tra[2]]
+
+    # Same product as orderMult (typ=1 multiplies in reverse order). The three rotations form an
+    # intrinsic Euler sequence, built in closed form; rotations before 'T' also rotate the translation
+    sequence = transformSequence(order)
+    if typ == 1:
+        sequence = sequence[::-1]
+    axes = sequence.replace('T', '')
+    for axis in reversed(sequence[:sequence.index('T')]):
+        translation = _rotate_about(axis, angles[axis], translation)
+
+    RotMat = np.eye(4)
+    RotMat[:3, :3] = euler_to_dcm([angles[axis] for axis in axes], axes)
+    RotMat[:3, 3] = translation
+    return RotMat
 
-    Tr = np.matrix([[1, 0, 0, tx], [0, 1, 0, ty], [0, 0, 1, tz], [0, 0, 0, 1]])
-    Rx = np.matrix([[1, 0, 0, 0], [0, np.cos(theta_x), -np.sin(theta_x), 0], [0, np.sin(theta_x), np.cos(theta_x), 0],
-                    [0, 0, 0, 1]])
-    Ry = np.matrix([[np.cos(theta_y), 0, np.sin(theta_y), 0], [0, 1, 0, 0], [-np.sin(theta_y), 0, np.cos(theta_y), 0],
-                    [0, 0, 0, 1]])
-    Rz = np.matrix([[np.cos(theta_z), -np.sin(theta_z), 0, 0], [np.sin(theta_z), np.cos(theta_z), 0, 0], [0, 0, 1, 0],
-                    [0, 0, 0, 1]])
 
-    RotMat = orderMult(order, Tr, Rx, Ry, Rz, typ)
-    Xf = RotMat @ Xc
+def _rotate_about(axis, angle, vector):
+    """vector rotated anti-clockwise by angle (radians) about the 'X', 'Y' or 'Z' axis"""
+    c, s = math.cos(angle), math.sin(angle)
+    x, y, z = vector
+    if axis == 'X':
+        return [x, c*y - s*z, s*y + c*z]
+    if axis == 'Y':
+        return [c*x + s*z, y, c*z - s*x]
+    return [c*x - s*y, s*x + c*y, z]
+
+
+def transform_points(points, order='TXYZ', Tra=[0, 0, 0], a_x=0, a_y=0, a_z=0, typ=1):
+    """Vectorized coordinateTransform for a whole point cloud
+            The composed matrix is built once and applied to all points in one matmul
+
+    Args:
+        points (array): [(N,3) points to be transformed]
+        order (str): [order of transformation and rotation]. Defaults to 'TXYZ'.
+        Tra (list):  [Translation of a coordinate or point]. Defaults to [0,0,0].
+        a_x (float):   [anti-clockwise rotation along the x-axis]. Defaults to 0.
+        a_y (float):   [anti-clockwise rotation along the y-axis]. Defaults to 0.
+        a_z (float):   [anti-clockwise rotation along the z-axis]. Defaults to 0.
+        typ (int, optional): [1 & 2 (1: for coordinate transformation, 2: for point transformation with fix coordinate)].Defaults to 1.
+
+    Returns:
+        [ndarray]: (N,3) point coordinates after transformation
+    """
+    return compile_transform(order, Tra, a_x, a_y, a_z, typ).apply(points)
+
+
+class CompiledTransform:
+    """Composed 4x4 transformation matrix and its inverse for one set of transform settings
+
+    Args:
+        matrix (ndarray): [4x4 homogeneous matrix, as built by transformMatrix]
+    """
+    __slots__ = ('matrix', 'inverse')
+
+    def __init__(self, matrix):
+        matrix = np.array(matrix, dtype=float)
+        # Rigid transform: the inverse is [R.T, -R.T @ t]
+        inverse = np.eye(4)
+        inverse[:3, :3] = matrix[:3, :3].T
+        inverse[:3, 3] = -matrix[:3, :3].T @ matrix[:3, 3]
+        # Instances are shared through the cache, so keep them immutable
+        matrix.flags.writeable = False
+        inverse.flags.writeable = False
+        self.matrix = matrix
+        self.inverse = inverse
+
+    @staticmethod
+    def _apply(matrix, points, out=None):
+        if out is None:
+            points = np.asarray(points, dtype=float).reshape(-1, 3)
+            return points @ matrix[:3, :3].T + matrix[:3, 3]
+        # Write straight into out (e.g. a memmap tile); out may be points itself
+        np.matmul(points, matrix[:3, :3].T, out=out)
+        out += matrix[:3, 3]
+        return out
+
+    def apply(self, points, out=None):
+        """Transforms (N,3) points, returns (N,3) ndarray (written into out if given)"""
+        return self._apply(self.matrix, points, out)
+
+    def apply_inverse(self, points, out=None):
+        """Undoes the transform for (N,3) points, returns (N,3) ndarray (written into out if given)"""
+        return self._apply(self.inverse, points, out)
+
+    def apply_point(self, point):
+        """Transforms a single point, returns [x, y, z] list as coordinateTransform does"""
+        Xf = self.matrix @ np.array([point[0], point[1], point[2], 1])
+        return Xf[:3].tolist()
+
+
+@lru_cache(maxsize=TRANSFORM_CACHE_SIZE)
+def _compile_transform(order, Tra, a_x, a_y, a_z, typ):
+    return CompiledTransform(transformMatrix(order, Tra, a_x, a_y, a_z, typ))
+
+
+def compile_transform(order='TXYZ', Tra=[0, 0, 0], a_x=0, a_y=0, a_z=0, typ=1):
+    """Returns the cached CompiledTransform for the given settings
+            Repeated calls with the same settings skip all trig and matrix construction
+
+    Args:
+        order (str): [order of transformation and rotation]. Defaults to 'TXYZ'.
+        Tra (list):  [Translation of a coordinate or point]. Defaults to [0,0,0].
+        a_x (float):   [anti-clockwise rotation along the x-axis]. Defaults to 0.
+        a_y (float):   [anti-clockwise rotation along the y-axis]. Defaults to 0.
+        a_z (float):   [anti-clockwise rotation along the z-axis]. Defaults to 0.
+        typ (int, optional): [1 & 2 (1: for coordinate transformation, 2: for point transformation with fix coordinate)].Defaults to 1.
+
+    Returns:
+        [CompiledTransform]: composed matrix and its inverse
+    """
+    return _compile_transform(order, (float(Tra[0]), float(Tra[1]), float(Tra[2])),
+                              float(a_x), float(a_y), float(a_z), typ)
+
+
+def transform_cache_info():
+    """Hit/miss counters of the compile_transform cache
+
+    Returns:
+        [CacheInfo]: named tuple (hits, misses, maxsize, currsize)
+    """
+    return _compile_transform.cache_info()
+
 
-    Xf = Xf[0:3].tolist()
-    return [Xf[0][0], Xf[1][0], Xf[2][0]]
+def clear_transform_cache():
+    """Empties the compile_transform cache and resets its counters"""
+    _compile_transform.cache_clear()
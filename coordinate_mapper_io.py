@@ -0,0 +1,105 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Binary (N,3) point I/O for coordinate_mapper transforms
+
+Points are read from .npy files or raw float32/float64 binary files through memory maps
+and transformed tile by tile, either in place or into a preallocated output memmap, so
+files larger than RAM can be processed.
+"""
+import os
+
+import numpy as np
+
+import coordinate_mapper as cm
+
+# Points per tile (24 MB of float64 points)
+DEFAULT_TILE_SIZE = 1 << 20
+
+
+def open_points(path, dtype=None, mode='r'):
+    """Memory-maps an (N,3) point array from a .npy file or a raw binary file
+
+    Args:
+        path (str): [.npy file, or raw file of consecutive x, y, z values]
+        dtype (str): [dtype of a raw file, ignored for .npy]. Defaults to float64.
+        mode (str): [memmap mode, 'r' or 'r+']. Defaults to 'r'.
+
+    Returns:
+        [memmap]: (N,3) point array
+    """
+    if str(path).endswith('.npy'):
+        points = np.load(path, mmap_mode=mode)
+    else:
+        points = np.memmap(path, dtype=dtype or np.float64, mode=mode)
+        if points.size % 3:
+            raise ValueError(f"{path}: size is not a multiple of 3 values")
+        points = points.reshape(-1, 3)
+    if points.ndim != 2 or points.shape[1] != 3:
+        raise ValueError(f"{path}: expected an (N,3) array, got shape {points.shape}")
+    return points
+
+
+def create_points(path, n_points, dtype=np.float64):
+    """Creates a preallocated (N,3) output memmap as .npy or raw binary file
+
+    Args:
+        path (str): [output file, .npy gets a header, anything else is written raw]
+        n_points (int): [number of points]
+        dtype (str): [output dtype]. Defaults to float64.
+
+    Returns:
+        [memmap]: writable (N,3) point array
+    """
+    if str(path).endswith('.npy'):
+        return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(n_points, 3))
+    return np.memmap(path, dtype=dtype, mode='w+', shape=(n_points, 3))
+
+
+def transform_array(points, out, transform, tile_size=DEFAULT_TILE_SIZE):
+    """Applies a CompiledTransform to points tile by tile, writing into out
+
+    Args:
+        points (array): [(N,3) input points, may be a memmap]
+        out (array): [(N,3) output array, may be points itself for an in-place transform]
+        transform (CompiledTransform): [transform from coordinate_mapper.compile_transform]
+        tile_size (int): [points per tile]. Defaults to DEFAULT_TILE_SIZE.
+
+    Returns:
+        [array]: out
+    """
+    for start in range(0, len(points), tile_size):
+        stop = min(start + tile_size, len(points))
+        transform.apply(points[start:stop], out=out[start:stop])
+    return out
+
+
+def transform_binary_file(input_path, output_path=None, order='TXYZ', Tra=[0, 0, 0], a_x=0, a_y=0, a_z=0, typ=1,
+                          dtype=None, out_dtype=None, tile_size=DEFAULT_TILE_SIZE):
+    """Transforms a binary point file with coordinateTransform's math
+
+    Args:
+        input_path (str): [.npy or raw binary (N,3) point file]
+        output_path (str): [.npy or raw output file, None (or input_path) to transform in place]
+        order, Tra, a_x, a_y, a_z, typ: [transform settings, as in coordinate_mapper.coordinateTransform]
+        dtype (str): [dtype of a raw input file]. Defaults to float64.
+        out_dtype (str): [output dtype]. Defaults to the input dtype.
+        tile_size (int): [points per tile]. Defaults to DEFAULT_TILE_SIZE.
+
+    Returns:
+        [int]: number of points transformed
+    """
+    transform = cm.compile_transform(order, Tra, a_x, a_y, a_z, typ)
+    in_place = output_path is None or os.path.abspath(output_path) == os.path.abspath(input_path)
+    if in_place:
+        points = open_points(input_path, dtype, mode='r+')
+        out = points
+    else:
+        points = open_points(input_path, dtype, mode='r')
+        out = create_points(output_path, len(points), out_dtype or points.dtype)
+    transform_array(points, out, transform, tile_size)
+    out.flush()
+    return len(points)
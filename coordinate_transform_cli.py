@@ -0,0 +1,201 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Command-line tool to stream point files through coordinate_mapper transforms
+
+Example:
+    python coordinate_transform_cli.py nodes.csv nodes_out.csv --order TXYZ --translation 1 1 1 --angles 180 45 90 --typ 1
+
+The input is read in fixed-size chunks, each chunk is transformed with one matmul and
+written straight to the output, so memory use does not depend on the file size.
+Only the x, y, z columns are replaced: header lines, comment lines and every other column
+(node IDs, loads, ...) are copied through, so the output joins back to the input line by line.
+.npy and raw binary files (.bin, .raw, .dat) go through the memory-mapped path of
+coordinate_mapper_io instead of text parsing.
+"""
+import argparse
+import sys
+import time
+from itertools import islice
+
+import numpy as np
+
+import coordinate_mapper as cm
+import coordinate_mapper_io as cmio
+
+BINARY_EXTENSIONS = ('.npy', '.bin', '.raw', '.dat')
+
+
+def _detect_delimiter(path, skip_header, comments):
+    """Returns ',' if the first data line is comma separated, otherwise None (any whitespace)"""
+    with open(path, 'r') as f:
+        for line in islice(f, skip_header, None):
+            line = line.split(comments, 1)[0].strip()
+            if line:
+                return ',' if ',' in line else None
+    return None
+
+
+def iter_point_chunks(f, chunk_size=100000, delimiter=None, usecols=(0, 1, 2), comments='#'):
+    """Yields (n,3) float arrays parsed from at most chunk_size lines of an open text file
+
+    Args:
+        f (file): [open text file, positioned after any header lines]
+        chunk_size (int): [number of lines parsed per chunk]. Defaults to 100000.
+        delimiter (str): [column delimiter, None for any whitespace]. Defaults to None.
+        usecols (tuple): [columns holding x, y, z]. Defaults to (0, 1, 2).
+        comments (str): [comment character]. Defaults to '#'.
+    """
+    while True:
+        lines = list(islice(f, chunk_size))
+        if not lines:
+            return
+        # A chunk of only comments or blank lines would make np.loadtxt warn about empty input
+        lines = [line for line in lines if line.split(comments, 1)[0].strip()]
+        if lines:
+            yield np.loadtxt(lines, delimiter=delimiter, usecols=usecols, comments=comments, ndmin=2)
+
+
+def _plain_points(lines, delimiter, usecols, comments):
+    """(n,3) points if every line holds exactly x, y, z (no comments, blanks or other columns), else None"""
+    if tuple(usecols) != (0, 1, 2) or any(comments in line or not line.strip() for line in lines):
+        return None
+    try:
+        points = np.loadtxt(lines, delimiter=delimiter, ndmin=2)
+    except ValueError:
+        return None
+    return points if points.shape[1] == 3 else None
+
+
+def transform_lines(lines, transform, delimiter=None, usecols=(0, 1, 2), fmt='%.6f', out_delimiter='\t',
+                    comments='#'):
+    """Transforms the x, y, z columns of a chunk of text lines, passing everything else through
+
+    Args:
+        lines (list): [text lines, with or without line endings]
+        transform (CompiledTransform): [transform applied to the points]
+        delimiter (str): [column delimiter, None for any whitespace]. Defaults to None.
+        usecols (tuple): [columns holding x, y, z]. Defaults to (0, 1, 2).
+        fmt (str): [printf format of each transformed value]. Defaults to '%.6f'.
+        out_delimiter (str): [delimiter written between the columns of data lines]. Defaults to a tab.
+        comments (str): [comment character, comment and blank lines are copied as they are]. Defaults to '#'.
+
+    Returns:
+        [list]: output lines, each ending with a newline
+    """
+    points = _plain_points(lines, delimiter, usecols, comments)
+    if points is not None:
+        # Nothing but x, y, z on every line: format the whole chunk in one call
+        out = transform.apply(points)
+        return [(out_delimiter.join([fmt] * 3) + '\n') * len(out) % tuple(out.ravel())]
+
+    out_lines = [line if line.endswith('\n') else line + '\n' for line in lines]
+    rows, fields, tails = [], [], []
+    for k, line in enumerate(lines):
+        data, sep, comment = line.rstrip('\r\n').partition(comments)
+        if data.strip():
+            rows.append(k)
+            fields.append(data.strip().split(delimiter) if delimiter else data.split())
+            tails.append(sep + comment)
+    if not rows:
+        return out_lines
+
+    points = np.array([[row_fields[c] for c in usecols] for row_fields in fields], dtype=float)
+    out = transform.apply(points)
+    # One string formatting call for the whole chunk
+    values = (fmt + '\n') * out.size % tuple(out.ravel())
+    values = values.split('\n')
+    for i, (k, row_fields, tail) in enumerate(zip(rows, fields, tails)):
+        for j, c in enumerate(usecols):
+            row_fields[c] = values[3*i + j]
+        out_lines[k] = out_delimiter.join(row_fields) + tail + '\n'
+    return out_lines
+
+
+def transform_text_file(input_path, output_path, order='TXYZ', Tra=[0, 0, 0], a_x=0, a_y=0, a_z=0, typ=1,
+                        chunk_size=100000, delimiter='auto', usecols=(0, 1, 2), skip_header=0,
+                        fmt='%.6f', out_delimiter=None, comments='#'):
+    """Streams a CSV or whitespace-delimited point file through coordinateTransform's math
+            The x, y, z columns are replaced, header, comment lines and other columns are copied
+
+    Args:
+        input_path (str): [text file with one point per line]
+        output_path (str): [file to write transformed points to]
+        order, Tra, a_x, a_y, a_z, typ: [transform settings, as in coordinate_mapper.coordinateTransform]
+        chunk_size (int): [number of points held in memory at once]. Defaults to 100000.
+        delimiter (str): ['auto', ',' or None for whitespace]. Defaults to 'auto'.
+        usecols (tuple): [columns holding x, y, z]. Defaults to (0, 1, 2).
+        skip_header (int): [number of header lines, copied to the output as they are]. Defaults to 0.
+        fmt (str): [printf format of each output value]. Defaults to '%.6f'.
+        out_delimiter (str): [output delimiter, defaults to the input delimiter or a tab]
+        comments (str): [comment character]. Defaults to '#'.
+
+    Returns:
+        [int]: number of points transformed
+    """
+    if delimiter == 'auto':
+        delimiter = _detect_delimiter(input_path, skip_header, comments)
+    if out_delimiter is None:
+        out_delimiter = delimiter or '\t'
+
+    transform = cm.compile_transform(order, Tra, a_x, a_y, a_z, typ)
+    n_points = 0
+    with open(input_path, 'r') as fin, open(output_path, 'w') as fout:
+        fout.writelines(islice(fin, skip_header))
+        while True:
+            lines = list(islice(fin, chunk_size))
+            if not lines:
+                break
+            fout.writelines(transform_lines(lines, transform, delimiter, usecols, fmt, out_delimiter, comments))
+            n_points += sum(1 for line in lines if line.split(comments, 1)[0].strip())
+    return n_points
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Transform point files with coordinate_mapper in constant memory')
+    parser.add_argument('input', help='CSV or whitespace-delimited point file')
+    parser.add_argument('output', help='output file')
+    parser.add_argument('--order', default='TXYZ', help='order of transformation and rotation (default: TXYZ)')
+    parser.add_argument('--translation', nargs=3, type=float, default=[0.0, 0.0, 0.0], metavar=('TX', 'TY', 'TZ'))
+    parser.add_argument('--angles', nargs=3, type=float, default=[0.0, 0.0, 0.0], metavar=('AX', 'AY', 'AZ'),
+                        help='anti-clockwise rotations along x, y, z in degrees')
+    parser.add_argument('--typ', type=int, choices=[1, 2], default=1,
+                        help='1: coordinate transformation, 2: point transformation (default: 1)')
+    parser.add_argument('--chunk-size', type=int, default=100000, help='points per chunk (default: 100000)')
+    parser.add_argument('--delimiter', default='auto', help="input delimiter: 'auto', ',' or 'whitespace'")
+    parser.add_argument('--usecols', nargs=3, type=int, default=[0, 1, 2], help='columns holding x, y, z')
+    parser.add_argument('--skip-header', type=int, default=0, help='number of header lines (copied to the output)')
+    parser.add_argument('--fmt', default='%.6f', help='output number format (default: %%.6f)')
+    parser.add_argument('--binary', action='store_true',
+                        help='treat input/output as binary point files (implied by .npy/.bin/.raw/.dat)')
+    parser.add_argument('--dtype', default='float64', choices=['float64', 'float32'],
+                        help='dtype of raw binary input (default: float64)')
+    parser.add_argument('--out-dtype', choices=['float64', 'float32'], help='binary output dtype (default: input dtype)')
+    parser.add_argument('--tile-size', type=int, default=cmio.DEFAULT_TILE_SIZE,
+                        help='points per tile for binary files')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    delimiter = None if args.delimiter == 'whitespace' else args.delimiter
+
+    start = time.perf_counter()
+    if args.binary or args.input.lower().endswith(BINARY_EXTENSIONS):
+        n_points = cmio.transform_binary_file(args.input, args.output, args.order, args.translation, *args.angles,
+                                              typ=args.typ, dtype=args.dtype, out_dtype=args.out_dtype,
+                                              tile_size=args.tile_size)
+    else:
+        n_points = transform_text_file(args.input, args.output, args.order, args.translation, *args.angles,
+                                       typ=args.typ, chunk_size=args.chunk_size, delimiter=delimiter,
+                                       usecols=tuple(args.usecols), skip_header=args.skip_header, fmt=args.fmt)
+    elapsed = time.perf_counter() - start
+    rate = n_points / elapsed if elapsed > 0 else float('inf')
+    print(f"Transformed {n_points} points in {elapsed:.3f} s ({rate:,.0f} points/sec)", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
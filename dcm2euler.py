@@ -1,5 +1,13 @@
+import math
+
 import numpy as np
 
+from rotation import EULER_SEQUENCES as SEQUENCES, GIMBAL_LOCK_TOL, SEQUENCE_TABLE, dcm_to_euler
+
+def _check_sequence(sequence):
+    if sequence not in SEQUENCES:
+        raise TypeError(f'Sorry,Implemented for these sequences only {", ".join(SEQUENCES)}')
+
 def dcm2rotation(R, sequence="XYZ"):
     
     """
@@ -7,46 +15,67 @@ def dcm2rotation(R, sequence="XYZ"):
 
     Parameters:
         R (numpy.ndarray): 3x3 rotation matrix representing the DCM.
-        sequence (str): String specifying the desired rotation sequence. Defaults to 'TXYZ'.
+        sequence (str): String specifying the desired rotation sequence. Defaults to 'XYZ'.
                         
 
     Returns:
         tuple: Tuple of three Euler angles (theta1, theta2, theta3) in radians.
 
     Raises:
-        TypeError: If an invalid sequence is provided. Implemented for "XYZ","ZXY","YZX","ZYX","YXZ","XZY" only
+        TypeError: If an invalid sequence is provided. Implemented for the 12 sequences in SEQUENCES
         
     Notes:
-        - The function uses the numpy library for array operations and trigonometric functions.
+        - Scalar kernel driven by rotation.SEQUENCE_TABLE, on plain floats (no array overhead).
+        - R.T = R_1(theta1) @ R_2(theta2) @ R_3(theta3) for sequence "123".
+        - In gimbal lock theta3 is set to 0 and theta1 carries the combined rotation.
 
     """
     
-    available = ["XYZ","ZXY","YZX","ZYX","YXZ","XZY"] 
-    avail_posi = ["XYZ","ZXY","YZX"]
-    
-    if sequence in available:
-        i= -1 if sequence in avail_posi else 1
-        
-        MatDict = {char: ord(char) for char in sequence}
+    _check_sequence(sequence)
+    a, b, c, s, proper = SEQUENCE_TABLE[sequence]
+    R = np.asarray(R, dtype=float).tolist()
 
-        MatDict['X'] = 0
-        MatDict['Y'] = 1
-        MatDict['Z'] = 2
+    if proper:
+        R2 = math.acos(min(1.0, max(-1.0, R[a][a])))
+        if math.hypot(R[a][b], R[a][c]) < GIMBAL_LOCK_TOL:
+            return math.atan2(s*R[b][c], R[b][b]), R2, 0.0
+        R1 = math.atan2(R[a][b], -s*R[a][c])
+        R3 = math.atan2(R[b][a], s*R[c][a])
+    else:
+        R2 = math.asin(min(1.0, max(-1.0, s*R[c][a])))
+        if math.hypot(R[c][b], R[c][c]) < GIMBAL_LOCK_TOL:
+            return math.atan2(s*R[b][c], R[b][b]), R2, 0.0
+        R1 = math.atan2(-s*R[c][b], R[c][c])
+        R3 = math.atan2(-s*R[b][a], R[a][a])
 
-        keys = list(MatDict.keys())
+    return R1, R2, R3
 
-        a = MatDict[keys[0]]
-        b = MatDict[keys[1]]
-        c = MatDict[keys[2]] 
+def dcm2rotation_batch(R, sequence="XYZ"):
 
-        R1 = np.arctan2(i*R[c, b], R[c, c])
-        R2 = np.arcsin(i*-R[c, a])
-        R3 = np.arctan2(i*R[b, a], R[a, a])
+    """
+    Converts a stack of Direction Cosine Matrices (DCM) to Euler angles in one pass.
+
+    Parameters:
+        R (numpy.ndarray): (N,3,3) stack of rotation matrices (a single 3x3 matrix is also accepted).
+        sequence (str): String specifying the desired rotation sequence. Defaults to 'XYZ'.
+
+    Returns:
+        numpy.ndarray: (N,3) array of Euler angles (theta1, theta2, theta3) in radians.
+
+    Raises:
+        TypeError: If an invalid sequence is provided. Implemented for the 12 sequences in SEQUENCES
+
+    Notes:
+        - Same convention as dcm2rotation, evaluated with array-wide arctan2/arcsin/arccos.
+        - Gimbal-lock elements are resolved with np.where in the same pass:
+          theta3 is set to 0 and theta1 carries the combined rotation.
+
+    """
+
+    _check_sequence(sequence)
+    R = np.asarray(R, dtype=float).reshape(-1, 3, 3)
+    return dcm_to_euler(np.transpose(R, (0, 2, 1)), sequence)
 
-        return R1, R2, R3
-    else:
-        raise TypeError('Sorry,Implemented for this sequence only "XYZ","ZXY","YZX","ZYX","YXZ","XZY"')
-        
 if __name__ == '__main__':
 
     lmn= np.array([[0.5,0.090524305,0.861281226],
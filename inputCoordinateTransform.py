@@ -6,13 +6,9 @@
 @status:    development
 @Version:   python3
 @Function:  Script to run coordinate transformation
+            For point files use coordinate_transform_cli.py, which streams them in chunks
 """
 
-import sys
-
-PYTHONTOOLSDIR = r'K:\Users\pramod.kumar\Sandbox\pythonProjects'
-sys.path.append(PYTHONTOOLSDIR)
-
 import coordinate_mapper as cm
 
 # ******* Input Transformation Setting *******#
@@ -35,19 +31,12 @@ ini_coord = [
     # [7, 8, 9],
 ]
 
-point_in = []
-point_out = []
-for p in ini_coord:
+point_in = ini_coord
+# Transform all points at once with the composed matrix
+point_out = cm.transform_points(ini_coord, order, Tra, a_x, a_y, a_z, typ).round(4).tolist()
+for p, pout in zip(point_in, point_out):
     print("Initial Coordinate:\t", str(p))
-    point_f = ['%.5f' % elem for elem in p]
-    # point_f=["{0:06.5f}".format(elem) for elem in p]
-#     print("Initial Coordinate:\t", point_f)
-#     point_in.append(point_f)
-    point_in.append(p)
-    pout = cm.coordinateTransform(order, Tra, a_x, a_y, a_z, p, typ)
     print("Coordinate After Transformations:\t", str(pout))
-    pout_round = [round(elem, 4) for elem in pout]
-    point_out.append(pout_round)
 
 with open('OutputCoordTransf.txt', 'w') as f:
     f.write("Order of transformation:\t{}\n".format(order))
@@ -0,0 +1,211 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Columnar (NPZ) load-case files with loss-free JSON import/export
+
+Example:
+    python load_case_io.py load_input.json load_input.npz     (JSON -> NPZ)
+    python load_case_io.py load_input.npz load_input.json     (NPZ -> JSON)
+
+A load case (the 'loads' and 'targets' of load_input.json) is stored as contiguous arrays:
+    load_force, load_moment, load_euler_angles, load_translation    (N,3) float64
+    load_rotation_order                                             (N,) str
+    target_euler_angles, target_translation                         (M,3) float64
+    target_rotation_order                                           (M,) str
+    load_meta, target_meta                                          (N,), (M,) JSON str of
+                                                                    the other keys (name, color, ...)
+    load_present, target_present                                    (N,4), (M,2) bool, which
+                                                                    vector keys the dict had
+A missing vector key is stored as zeros (the value the transfer uses) and dropped again on
+reading, so JSON -> NPZ -> JSON gives back the same dictionaries.
+Angles stay in degrees, as in the JSON form. Files are written uncompressed, so every
+numeric column can be memory-mapped straight out of the archive instead of being parsed.
+"""
+import io
+import json
+import os
+import struct
+import sys
+import zipfile
+
+import numpy as np
+
+import rigid_load_transfer as rlt
+
+VECTOR_FIELDS = {
+    'load': ('force', 'moment', 'euler_angles', 'translation'),
+    'target': ('euler_angles', 'translation')
+}
+FORMAT_VERSION = 2
+
+
+def load_case_columns(loads, targets):
+    """Columns of a load case given as lists of load and target dictionaries
+
+    Args:
+        loads (list): [load dictionaries, as in load_input.json]
+        targets (list): [target dictionaries]
+
+    Returns:
+        [dict]: column name -> array, see the module docstring
+    """
+    columns = {'format_version': np.array(FORMAT_VERSION)}
+    for kind, items in (('load', loads), ('target', targets)):
+        for field in VECTOR_FIELDS[kind]:
+            columns[f'{kind}_{field}'] = np.array([item.get(field, [0.0, 0.0, 0.0]) for item in items],
+                                                  dtype=float).reshape(-1, 3)
+        columns[f'{kind}_present'] = np.array([[field in item for field in VECTOR_FIELDS[kind]] for item in items],
+                                              dtype=bool).reshape(-1, len(VECTOR_FIELDS[kind]))
+        columns[f'{kind}_rotation_order'] = np.array([item['rotation_order'] for item in items], dtype=str)
+        skip = set(VECTOR_FIELDS[kind]) | {'rotation_order'}
+        columns[f'{kind}_meta'] = np.array([json.dumps({key: value for key, value in item.items() if key not in skip})
+                                            for item in items], dtype=str)
+    return columns
+
+
+def save_load_case(path, loads, targets):
+    """Writes a load case as an uncompressed NPZ file (memory-mappable columns)"""
+    np.savez(path, **load_case_columns(loads, targets))
+
+
+def _memmap_member(path, zf, name):
+    """Memory map of an uncompressed .npy member of an NPZ archive, None if it cannot be mapped"""
+    info = zf.getinfo(name)
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(path, 'rb') as f:
+        # Local file header: 30 bytes, then the file name and the extra field
+        f.seek(info.header_offset)
+        name_length, extra_length = struct.unpack('<HH', f.read(30)[26:30])
+        f.seek(info.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if dtype.hasobject or 0 in shape:
+        return None
+    return np.memmap(path, dtype=dtype, mode='r', shape=shape, offset=offset,
+                     order='F' if fortran_order else 'C')
+
+
+class LoadCaseFile:
+    """
+    Lazily loaded NPZ load case: a column is read (memory-mapped when possible) on first
+    access and kept, nothing is parsed up front.
+    """
+    def __init__(self, path, mmap=True):
+        self.path = path
+        self.mmap = mmap
+        self._columns = {}
+        with zipfile.ZipFile(path) as zf:
+            self.names = [name[:-4] for name in zf.namelist() if name.endswith('.npy')]
+
+    def __repr__(self):
+        return f"LoadCaseFile({self.path!r}, loads={self.n_loads}, targets={self.n_targets})"
+
+    def __contains__(self, column):
+        return column in self.names
+
+    def __getitem__(self, column):
+        if column not in self._columns:
+            if column not in self.names:
+                raise KeyError(f"{self.path}: no column {column!r}")
+            array = None
+            with zipfile.ZipFile(self.path) as zf:
+                if self.mmap:
+                    array = _memmap_member(self.path, zf, column + '.npy')
+                if array is None:
+                    with zf.open(column + '.npy') as f:
+                        array = np.lib.format.read_array(f)
+            self._columns[column] = array
+        return self._columns[column]
+
+    @property
+    def n_loads(self):
+        return len(self['load_rotation_order'])
+
+    @property
+    def n_targets(self):
+        return len(self['target_rotation_order'])
+
+    def target_names(self):
+        return [json.loads(meta).get('name', f'Target {i+1}') for i, meta in enumerate(self['target_meta'])]
+
+    def resultants(self):
+        """(M,6) resultants [Fx, Fy, Fz, Mx, My, Mz] in each target system, straight from the columns"""
+        return rlt.transfer_loads_to_targets(
+            self['load_force'], self['load_moment'], np.radians(self['load_euler_angles']),
+            self['load_rotation_order'].tolist(), self['load_translation'],
+            np.radians(self['target_euler_angles']), self['target_rotation_order'].tolist(),
+            self['target_translation'])
+
+    def to_dicts(self):
+        """(loads, targets) as lists of dictionaries, the JSON form"""
+        return columns_to_dicts(self)
+
+
+def columns_to_dicts(columns):
+    """(loads, targets) dictionaries of load-case columns (a LoadCaseFile, NpzFile or dict)"""
+    systems = {}
+    for kind in ('load', 'target'):
+        vectors = {field: np.asarray(columns[f'{kind}_{field}']).tolist() for field in VECTOR_FIELDS[kind]}
+        orders = np.asarray(columns[f'{kind}_rotation_order']).tolist()
+        # Version 1 files have no presence mask, every vector key was written
+        present = (np.asarray(columns[f'{kind}_present']) if f'{kind}_present' in columns
+                   else np.ones((len(orders), len(VECTOR_FIELDS[kind])), dtype=bool))
+        items = []
+        for i, meta in enumerate(columns[f'{kind}_meta']):
+            item = json.loads(str(meta))
+            for k, field in enumerate(VECTOR_FIELDS[kind]):
+                if present[i, k]:
+                    item[field] = vectors[field][i]
+            item['rotation_order'] = orders[i]
+            items.append(item)
+        systems[kind] = items
+    return systems['load'], systems['target']
+
+
+def load_case_from_bytes(data):
+    """(loads, targets) dictionaries of an NPZ load case held in memory (e.g. an upload)"""
+    with np.load(io.BytesIO(data)) as columns:
+        return columns_to_dicts(columns)
+
+
+def open_load_case(path, mmap=True):
+    """LoadCaseFile of an NPZ load case"""
+    return LoadCaseFile(path, mmap=mmap)
+
+
+def read_load_case(path):
+    """(loads, targets) dictionaries of a JSON or NPZ load case"""
+    if str(path).endswith('.npz'):
+        return open_load_case(path).to_dicts()
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return data.get('loads', []), data.get('targets', [])
+
+
+def write_load_case(path, loads, targets):
+    """Writes a load case as JSON or NPZ, chosen by the file extension"""
+    if str(path).endswith('.npz'):
+        save_load_case(path, loads, targets)
+    else:
+        with open(path, 'w') as f:
+            json.dump({'loads': loads, 'targets': targets}, f, indent=4)
+
+
+def convert_load_case(input_path, output_path):
+    """Converts a load case between the JSON and NPZ forms"""
+    write_load_case(output_path, *read_load_case(input_path))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print(f"usage: python {os.path.basename(sys.argv[0])} INPUT.(json|npz) OUTPUT.(json|npz)", file=sys.stderr)
+        sys.exit(2)
+    convert_load_case(sys.argv[1], sys.argv[2])
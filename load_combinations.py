@@ -0,0 +1,155 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Superposition of load cases and min/max envelopes on a fixed geometry
+
+Example:
+    superposition = LoadSuperposition(loads, targets, degrees=True)
+    cases = stack_cases([dead_loads, live_loads, wind_loads])          # (C,N,6)
+    factors, names = factor_matrix({'ULS1': {'dead': 1.35, 'live': 1.5},
+                                    'ULS2': {'dead': 1.0, 'wind': 1.5}}, ['dead', 'live', 'wind'])
+    envelope = superposition.envelope(factors, cases)
+    envelope.maximum, names[envelope.argmax]                           # (M,6) and governing combinations
+
+Rigid transfer is linear in the load wrenches, so the geometry (load and target frames) is
+turned once into a 6x6 operator per (target, load) pair (rigid_load_transfer.transfer_operators),
+flattened to one (6N, 6M) matrix. The resultants of every load case are then one matrix
+product, and any number of factored combinations a second one.
+"""
+import numpy as np
+
+import rigid_load_transfer as rlt
+
+COMPONENTS = ('Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz')
+
+
+def stack_cases(cases):
+    """(C,N,6) local wrenches [Fx, Fy, Fz, Mx, My, Mz] of load cases
+
+    Args:
+        cases (list): [one list of load dictionaries per case, all with the loads in the same order]
+
+    Returns:
+        [ndarray]: (C,N,6) array
+    """
+    wrenches = []
+    for case in cases:
+        forces, moments = rlt._stack_loads(case)[:2]
+        wrenches.append(np.hstack([forces, moments]))
+    if len({len(w) for w in wrenches}) > 1:
+        raise ValueError("All load cases need the same number of loads")
+    return np.array(wrenches).reshape(len(wrenches), -1, 6)
+
+
+def factor_matrix(combinations, case_names):
+    """(K,C) factor matrix of named combinations
+
+    Args:
+        combinations (dict): [{combination name: {case name: factor}}], cases not listed get 0
+        case_names (list): [case names, in the order of the case axis]
+
+    Returns:
+        [tuple]: ((K,C) factors, (K,) combination names)
+    """
+    factors = np.zeros((len(combinations), len(case_names)))
+    index = {name: i for i, name in enumerate(case_names)}
+    for k, weights in enumerate(combinations.values()):
+        for case, factor in weights.items():
+            if case not in index:
+                raise ValueError(f"Unknown load case: {case}")
+            factors[k, index[case]] = factor
+    return factors, np.array(list(combinations), dtype=str)
+
+
+class Envelope:
+    """
+    Per-target minimum and maximum of Fx..Mz over combinations
+
+    Attributes:
+        minimum, maximum: (M,6) extreme values
+        argmin, argmax: (M,6) index of the governing combination of each extreme
+    """
+    __slots__ = ('minimum', 'maximum', 'argmin', 'argmax')
+
+    def __init__(self, resultants):
+        # resultants: (K,M,6) of K combinations
+        self.argmin = resultants.argmin(axis=0)
+        self.argmax = resultants.argmax(axis=0)
+        self.minimum = np.take_along_axis(resultants, self.argmin[np.newaxis], axis=0)[0]
+        self.maximum = np.take_along_axis(resultants, self.argmax[np.newaxis], axis=0)[0]
+
+    def to_frame(self, target_names=None, combination_names=None):
+        """pandas DataFrame, one row per (target, component) with min/max and governing combinations"""
+        import pandas as pd
+        n_targets = len(self.minimum)
+        target_names = np.asarray(target_names if target_names is not None
+                                  else [f'Target {i+1}' for i in range(n_targets)])
+        governing = (lambda index: np.asarray(combination_names)[index]) if combination_names is not None \
+            else (lambda index: index)
+        return pd.DataFrame({
+            'target': np.repeat(target_names, len(COMPONENTS)),
+            'component': np.tile(COMPONENTS, n_targets),
+            'min': self.minimum.ravel(),
+            'min_combination': governing(self.argmin.ravel()),
+            'max': self.maximum.ravel(),
+            'max_combination': governing(self.argmax.ravel())
+        })
+
+
+class LoadSuperposition:
+    """
+    Transfer operators of a fixed set of load and target frames, applied to any load values
+
+    Parameters:
+        loads: List of load dictionaries (only the frames are used: euler_angles, rotation_order, translation)
+        targets: List of target system dictionaries
+        degrees: euler_angles are given in degrees (as in load_input.json and the dashboard)
+    """
+    def __init__(self, loads, targets, degrees=False):
+        operators = rlt.transfer_operators_systems(loads, targets, degrees=degrees)
+        self.n_targets, self.n_loads = operators.shape[:2]
+        # matrix[(n,j), (m,i)] = operators[m,n,i,j], so (C,6N) wrenches @ matrix = (C,6M) resultants
+        self.matrix = operators.transpose(1, 3, 0, 2).reshape(6*self.n_loads, 6*self.n_targets)
+
+    def __repr__(self):
+        return f"LoadSuperposition(loads={self.n_loads}, targets={self.n_targets})"
+
+    def resultants(self, wrenches):
+        """
+        Resultants in every target system of local load wrenches
+
+        Parameters:
+            wrenches: (N,6) wrenches of one case, or (C,N,6) of C cases
+
+        Returns:
+            (M,6) or (C,M,6) resultants [Fx, Fy, Fz, Mx, My, Mz]
+        """
+        wrenches = np.asarray(wrenches, dtype=float)
+        if wrenches.shape[-2:] != (self.n_loads, 6):
+            raise ValueError(f"Expected wrenches of shape (..., {self.n_loads}, 6), got {wrenches.shape}")
+        flat = wrenches.reshape(-1, 6*self.n_loads) @ self.matrix
+        return flat.reshape(wrenches.shape[:-2] + (self.n_targets, 6))
+
+    def combine(self, factors, wrenches):
+        """
+        Resultants of factored load-case combinations
+
+        Parameters:
+            factors: (K,C) factor of each case in each combination (see factor_matrix)
+            wrenches: (C,N,6) local wrenches of the load cases (see stack_cases)
+
+        Returns:
+            (K,M,6) resultants of each combination in each target system
+        """
+        factors = np.atleast_2d(np.asarray(factors, dtype=float))
+        case_resultants = self.resultants(wrenches).reshape(len(wrenches), -1)
+        if factors.shape[1] != len(case_resultants):
+            raise ValueError(f"Got factors for {factors.shape[1]} cases and wrenches for {len(case_resultants)}")
+        return (factors @ case_resultants).reshape(len(factors), self.n_targets, 6)
+
+    def envelope(self, factors, wrenches):
+        """Envelope of the combinations of combine(factors, wrenches)"""
+        return Envelope(self.combine(factors, wrenches))
@@ -0,0 +1,240 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Parametric sweeps of a target (or load) frame for rigid load transfer
+
+Example:
+    result = sweep(loads, target, {'rz': np.arange(0, 360, 15), 'tz': np.linspace(0, 1, 11)}, degrees=True)
+    result.values.shape                 # (24, 11, 6)
+    worst = sweep_extremes(loads, target, {'rz': np.arange(0, 360, 0.1)}, degrees=True)
+    worst.governing('|F|')              # {'value': ..., 'rz': ...}
+
+The frame's Euler angles and translation components are swept over the grid spanned by
+the parameter ranges. Grid points are evaluated in chunks of flat indices, each chunk as
+one broadcast computation: the fixed systems are reduced once to a global force and
+moment, so a grid point costs one rotation matrix and a few 3-vector products.
+"""
+import numpy as np
+
+import rigid_load_transfer as rlt
+
+# Sweep parameter name -> (frame field, component)
+SWEEP_PARAMETERS = {
+    'rx': ('euler_angles', 0), 'ry': ('euler_angles', 1), 'rz': ('euler_angles', 2),
+    'tx': ('translation', 0), 'ty': ('translation', 1), 'tz': ('translation', 2)
+}
+COMPONENTS = ('Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz')
+# Extremes are also tracked for the force and moment magnitudes
+EXTREME_COLUMNS = COMPONENTS + ('|F|', '|M|')
+# Grid points evaluated per chunk (about 10 MB of temporaries)
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class SweepResult:
+    """
+    Resultants over a parameter grid
+
+    Attributes:
+        dims: parameter names, one per grid axis
+        coords: {dim: 1-D parameter values}
+        values: grid shape + (6,) array of [Fx, Fy, Fz, Mx, My, Mz]
+    """
+    __slots__ = ('dims', 'coords', 'values')
+
+    def __init__(self, dims, coords, values):
+        self.dims = tuple(dims)
+        self.coords = coords
+        self.values = values
+
+    def __repr__(self):
+        grid = ', '.join(f"{dim}: {len(self.coords[dim])}" for dim in self.dims)
+        return f"SweepResult({grid})"
+
+    @property
+    def shape(self):
+        return self.values.shape[:-1]
+
+    def component(self, name):
+        """Grid of one of COMPONENTS"""
+        return self.values[..., COMPONENTS.index(name)]
+
+    def location(self, index):
+        """{dim: value} of a grid index (flat or a tuple)"""
+        if np.ndim(index) == 0:
+            index = np.unravel_index(index, self.shape)
+        return {dim: self.coords[dim][i].item() for dim, i in zip(self.dims, index)}
+
+    def to_frame(self):
+        """Long pandas DataFrame, one row per grid point"""
+        import pandas as pd
+        mesh = np.meshgrid(*(self.coords[dim] for dim in self.dims), indexing='ij')
+        frame = pd.DataFrame({dim: grid.ravel() for dim, grid in zip(self.dims, mesh)})
+        for k, name in enumerate(COMPONENTS):
+            frame[name] = self.values[..., k].ravel()
+        return frame
+
+
+class SweepExtremes:
+    """
+    Minimum and maximum of every EXTREME_COLUMNS entry over a grid, with the flat grid
+    index where each one occurs
+    """
+    def __init__(self, dims, coords):
+        self.dims = tuple(dims)
+        self.coords = coords
+        self.shape = tuple(len(coords[dim]) for dim in self.dims)
+        self.minimum = np.full(len(EXTREME_COLUMNS), np.inf)
+        self.maximum = np.full(len(EXTREME_COLUMNS), -np.inf)
+        self.argmin = np.zeros(len(EXTREME_COLUMNS), dtype=np.int64)
+        self.argmax = np.zeros(len(EXTREME_COLUMNS), dtype=np.int64)
+
+    def update(self, start, resultants):
+        """Folds in the (k,6) resultants of flat grid indices start..start+k"""
+        columns = np.column_stack([resultants,
+                                   np.linalg.norm(resultants[:, :3], axis=1),
+                                   np.linalg.norm(resultants[:, 3:], axis=1)])
+        low, high = columns.argmin(axis=0), columns.argmax(axis=0)
+        low_values = columns[low, np.arange(columns.shape[1])]
+        high_values = columns[high, np.arange(columns.shape[1])]
+        lower, higher = low_values < self.minimum, high_values > self.maximum
+        self.minimum[lower] = low_values[lower]
+        self.argmin[lower] = start + low[lower]
+        self.maximum[higher] = high_values[higher]
+        self.argmax[higher] = start + high[higher]
+
+    def location(self, flat_index):
+        """{dim: value} of a flat grid index"""
+        index = np.unravel_index(flat_index, self.shape)
+        return {dim: self.coords[dim][i].item() for dim, i in zip(self.dims, index)}
+
+    def governing(self, column, kind='max'):
+        """Extreme value of a column ('Fx'..'Mz', '|F|', '|M|') and the parameters where it occurs"""
+        k = EXTREME_COLUMNS.index(column)
+        if kind == 'max':
+            return dict(value=self.maximum[k].item(), **self.location(self.argmax[k]))
+        if kind == 'min':
+            return dict(value=self.minimum[k].item(), **self.location(self.argmin[k]))
+        raise ValueError(f"Invalid kind: {kind}, expected 'min' or 'max'")
+
+
+def _check_parameters(params):
+    for name, values in params.items():
+        if name not in SWEEP_PARAMETERS:
+            raise ValueError(f"Invalid sweep parameter: {name}, expected one of {tuple(SWEEP_PARAMETERS)}")
+        if np.ndim(values) != 1 or len(values) == 0:
+            raise ValueError(f"Sweep parameter {name} needs a non-empty 1-D range of values")
+    if not params:
+        raise ValueError("No sweep parameters given")
+
+
+def _global_totals(loads, degrees):
+    """Total global force and moment about the global origin of a list of loads"""
+    if not loads:
+        return np.zeros(3), np.zeros(3)
+    forces, moments, angles, orders, translations = rlt._stack_loads(loads)
+    if degrees:
+        angles = np.radians(angles)
+    R, positions = rlt.create_rotation_matrices(angles, orders, translations)
+    forces_global = np.einsum('nij,nj->ni', R, forces)
+    moments_global = np.einsum('nij,nj->ni', R, moments) + np.cross(positions, forces_global)
+    return forces_global.sum(axis=0), moments_global.sum(axis=0)
+
+
+def _frame_kernel(loads, target, frame, load_index, degrees):
+    """
+    Returns (base frame dict, f) where f(R, positions) gives the (k,6) resultants for k
+    values of the swept frame's rotation matrices and positions
+    """
+    if frame == 'target':
+        force, moment = _global_totals(loads, degrees)
+
+        def evaluate(R, positions):
+            moments = moment - np.cross(positions, force)
+            return np.concatenate([np.einsum('kji,j->ki', R, force), np.einsum('kji,kj->ki', R, moments)], axis=1)
+        return target, evaluate
+
+    if frame == 'load':
+        swept = loads[load_index]
+        force, moment = _global_totals(loads[:load_index] + loads[load_index + 1:], degrees)
+        local_force = np.asarray(swept.get('force', [0, 0, 0]), dtype=float)
+        local_moment = np.asarray(swept.get('moment', [0, 0, 0]), dtype=float)
+        target_angles = np.radians(target['euler_angles']) if degrees else target['euler_angles']
+        R_target, target_pos = rlt.create_rotation_matrix(target_angles, target['rotation_order'], target['translation'])
+
+        def evaluate(R, positions):
+            forces = force + R @ local_force
+            moments = moment + R @ local_moment + np.cross(positions, R @ local_force)
+            moments -= np.cross(target_pos, forces)
+            return np.concatenate([forces @ R_target, moments @ R_target], axis=1)
+        return swept, evaluate
+
+    raise ValueError(f"Invalid frame: {frame}, expected 'target' or 'load'")
+
+
+def _iter_chunks(loads, target, params, frame, load_index, degrees, chunk_size):
+    """Yields (start, (k,6) resultants) over the flat grid, chunk_size points at a time"""
+    _check_parameters(params)
+    dims = list(params)
+    coords = [np.asarray(params[dim], dtype=float) for dim in dims]
+    shape = tuple(len(values) for values in coords)
+    base, evaluate = _frame_kernel(loads, target, frame, load_index, degrees)
+    base_angles = np.asarray(base['euler_angles'], dtype=float)
+    base_position = np.asarray(base['translation'], dtype=float)
+
+    n_points = int(np.prod(shape))
+    for start in range(0, n_points, chunk_size):
+        stop = min(start + chunk_size, n_points)
+        index = np.unravel_index(np.arange(start, stop), shape)
+        angles = np.tile(base_angles, (stop - start, 1))
+        positions = np.tile(base_position, (stop - start, 1))
+        for dim, values, i in zip(dims, coords, index):
+            field, component = SWEEP_PARAMETERS[dim]
+            (angles if field == 'euler_angles' else positions)[:, component] = values[i]
+        if degrees:
+            angles = np.radians(angles)
+        R, positions = rlt.create_rotation_matrices(angles, base['rotation_order'], positions)
+        yield start, evaluate(R, positions)
+
+
+def sweep(loads, target, params, frame='target', load_index=0, degrees=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Resultants in the target system over a grid of frame parameters
+
+    Parameters:
+        loads: List of load dictionaries (as in combine_loads)
+        target: Target system dictionary
+        params: {name: 1-D values} with names from SWEEP_PARAMETERS ('rx'..'rz', 'tx'..'tz').
+                The grid axes follow the dict order, parameters not given keep the frame's value.
+        frame: 'target' to sweep the target system, 'load' to sweep loads[load_index]
+        load_index: load swept when frame='load'
+        degrees: euler_angles and angle parameters are in degrees
+        chunk_size: grid points evaluated at a time
+
+    Returns:
+        SweepResult with values of shape grid + (6,)
+    """
+    dims = list(params)
+    coords = {dim: np.asarray(params[dim], dtype=float) for dim in dims}
+    values = np.empty((int(np.prod([len(coords[dim]) for dim in dims])), 6))
+    for start, resultants in _iter_chunks(loads, target, params, frame, load_index, degrees, chunk_size):
+        values[start:start + len(resultants)] = resultants
+    return SweepResult(dims, coords, values.reshape(tuple(len(coords[dim]) for dim in dims) + (6,)))
+
+
+def sweep_extremes(loads, target, params, frame='target', load_index=0, degrees=False,
+                   chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Minimum, maximum and their grid locations for every component and for |F| and |M|,
+    reduced chunk by chunk so the grid is never held in memory. Arguments as in sweep.
+
+    Returns:
+        SweepExtremes
+    """
+    dims = list(params)
+    extremes = SweepExtremes(dims, {dim: np.asarray(params[dim], dtype=float) for dim in dims})
+    for start, resultants in _iter_chunks(loads, target, params, frame, load_index, degrees, chunk_size):
+        extremes.update(start, resultants)
+    return extremes
@@ -20,23 +20,7 @@ import rigid_load_transfer as rlt
 #---------------------------------------
 # Calculation functions
 def create_rotation_matrix(euler_angles, rotation_order, translation):
-    R = np.eye(3)
-    for axis in reversed(rotation_order.lower()):
-        idx = rotation_order.lower().index(axis)
-        angle = euler_angles[idx]
-        R = R @ _axis_rotation(axis, angle)
-    return R, np.array(translation)
-
-def _axis_rotation(axis, angle):
-    cos_a = np.cos(angle)
-    sin_a = np.sin(angle)
-    if axis == 'x':
-        return np.array([[1, 0, 0], [0, cos_a, -sin_a], [0, sin_a, cos_a]])
-    elif axis == 'y':
-        return np.array([[cos_a, 0, sin_a], [0, 1, 0], [-sin_a, 0, cos_a]])
-    elif axis == 'z':
-        return np.array([[cos_a, -sin_a, 0], [sin_a, cos_a, 0], [0, 0, 1]])
-    raise ValueError(f"Invalid axis: {axis}")
+    return rlt.create_rotation_matrix(euler_angles, rotation_order, translation)
 
 def rigid_load_transfer(force_local_A, moment_local_A, R_A, point_A_global, R_B, point_B_global):
     force_global = R_A @ force_local_A
@@ -45,10 +29,67 @@ def rigid_load_transfer(force_local_A, moment_local_A, R_A, point_A_global, R_B,
     moment_global += np.cross(r, force_global)
     return R_B.T @ force_global, R_B.T @ moment_global
 # #---------------------------------------
+# Trace accumulator
+def _trace(trace_type, **kwargs):
+    """Raw trace dict, leaving out unset (None) attributes"""
+    return dict(type=trace_type, **{key: value for key, value in kwargs.items() if value is not None})
+
+class TraceAccumulator:
+    """
+    Collects raw trace dicts in a list and builds the figure once at the end.
+
+    Appending is O(1) per trace, unlike go.Figure(data=fig.data + ...) which copies and
+    re-validates every trace already in the figure.
+    """
+    def __init__(self, traces=None):
+        self.traces = list(traces) if traces is not None else []
+
+    def __len__(self):
+        return len(self.traces)
+
+    def add(self, trace):
+        self.traces.append(trace)
+        return self
+
+    def extend(self, traces):
+        self.traces.extend(traces)
+        return self
+
+    def figure(self, layout=None, validate=True):
+        """
+        Builds the figure. With validate=False a plain {'data', 'layout'} dict is returned,
+        which Dash and plotly.io accept without Plotly's per-trace validation.
+        """
+        if validate:
+            return go.Figure(data=self.traces, layout=layout)
+        return {'data': self.traces, 'layout': layout if layout is not None else {}}
+
+def vector_plot_layout(title="3D Vector Plot"):
+    """Layout shared by the vector and triad plots"""
+    return dict(
+        margin={'l': 0, 'r': 0, 'b': 0, 't': 30},
+        title=title,
+        width=700,
+        height=400,
+        showlegend=False,
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="right",
+            x=0.99,
+            bgcolor="rgba(255, 255, 255, 0.8)"
+        ),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Arial"
+        )
+    )
+# #---------------------------------------
 # Visualization helpers
-def create_vector(position, vector, color='red', name=None, legendgroup= None, triad_name=None):
+def vector_end(position, vector):
+    """Head of a force or moment arrow drawn at position, auto-scaled by the vector magnitude"""
     magnitude = np.linalg.norm(vector)
-    # print(magnitude)
     scale = max(0.5, min(2.0, magnitude/10))  # Auto-scale based on magnitude
     
     if magnitude<1e-6:
@@ -63,20 +104,24 @@ def create_vector(position, vector, color='red', name=None, legendgroup= None, t
     x=float(position[0]) + vector_x*scale
     y=float(position[1]) + vector_y*scale
     z=float(position[2]) + vector_z*scale
-    
-    list_load = [[float(position[0]),float(position[1]),float(position[2])],[x,y,z]]
-    # print(list_load)
-    fig = plot_lines_from_points(list_load, colors_tip=[color],size_tip=0.3, tip_hover_text=[name], legendgroup = legendgroup,triad_name=triad_name)
-    # fig = plot3d.plot_lines_from_points(list_load)
-    fig.update_layout(showlegend=False)
-    return fig 
+    return [float(x),float(y),float(z)]
 
-def create_connection_line(start_point, end_point, color='gray'):
-    """Create a dashed line connecting two points"""
-    return go.Scatter3d(
-        x=[start_point[0], end_point[0]],
-        y=[start_point[1], end_point[1]],
-        z=[start_point[2], end_point[2]],
+def vector_traces(position, vector, color='red', name=None, legendgroup= None, triad_name=None):
+    """
+    Line and arrow tip traces of a force or moment vector, auto-scaled by its magnitude.
+    """
+    list_load = [[float(position[0]),float(position[1]),float(position[2])], vector_end(position, vector)]
+    return lines_from_points_traces(list_load, colors_tip=[color],size_tip=0.3, tip_hover_text=[name], legendgroup = legendgroup,triad_name=triad_name)
+
+def create_vector(position, vector, color='red', name=None, legendgroup= None, triad_name=None):
+    return TraceAccumulator(vector_traces(position, vector, color, name, legendgroup, triad_name)).figure(vector_plot_layout())
+
+def connection_line_trace(start_point, end_point, color='gray'):
+    """Dashed line connecting two points, as a raw trace dict"""
+    return _trace('scatter3d',
+        x=[float(start_point[0]), float(end_point[0])],
+        y=[float(start_point[1]), float(end_point[1])],
+        z=[float(start_point[2]), float(end_point[2])],
         mode='lines',
         line=dict(
             color=color,
@@ -85,6 +130,10 @@ def create_connection_line(start_point, end_point, color='gray'):
         ),
         showlegend=False
     )
+
+def create_connection_line(start_point, end_point, color='gray'):
+    """Create a dashed line connecting two points"""
+    return go.Scatter3d(connection_line_trace(start_point, end_point, color))
 # #---------------------------------------
 def plot_3d_point(list):
     """
@@ -113,28 +162,17 @@ def plot_3d_point(list):
     plot_figure.update_layout(width=600,height=500,)
     return plot_figure
 
-def plot_arrow_tip(point_pair, sizetip=0.5, color='darkblue', name=None, showlegend=False, legendgroup=None,hover_text =None):
+def arrow_tip_traces(point_pair, sizetip=0.5, color='darkblue', name=None, showlegend=False, legendgroup=None,hover_text =None):
     """
-    Plots a vector tip cone from head and tail.
+    Cone trace (raw dict) of a vector tip from head and tail.
     """
-    x_data=[point_pair[i][0] for i in range(len(point_pair))]
-    y_data=[point_pair[i][1] for i in range(len(point_pair))]
-    z_data=[point_pair[i][2] for i in range(len(point_pair))]
-
-    vec_cone = np.array(point_pair[1])-np.array(point_pair[0])
-    vec_norm = np.linalg.norm(vec_cone)
-    # print(f'cone: {vec_cone}, {vec_norm}')
-    # print('vec_cone')
-    # u = np.where(vec_norm != 0, vec_cone[0]/vec_norm, 0)#vec_cone[0]/vec_norm
-    # v = np.where(vec_norm != 0, vec_cone[1]/vec_norm, 0)#vec_cone[1]/vec_norm
-    # w = np.where(vec_norm != 0, vec_cone[2]/vec_norm, 0)#vec_cone[2]/vec_norm
-    u = vec_cone[0]
-    v = vec_cone[1]
-    w = vec_cone[2]
-    fig = go.Figure(data=go.Cone(
-        x=[x_data[1]],
-        y=[y_data[1]],
-        z=[z_data[1]],
+    tail = np.asarray(point_pair[0], dtype=float)
+    head = np.asarray(point_pair[1], dtype=float)
+    u, v, w = (head - tail).tolist()
+    return [_trace('cone',
+        x=[float(head[0])],
+        y=[float(head[1])],
+        z=[float(head[2])],
         u=[u],
         v=[v],
         w=[w],
@@ -147,18 +185,22 @@ def plot_arrow_tip(point_pair, sizetip=0.5, color='darkblue', name=None, showleg
         hovertext=hover_text,
         name=name,
         showlegend=showlegend,
-        legendgroup=legendgroup))
-    
-    return fig
-    
-def plot_3d_line(point_list, color='darkblue', width=2, opacity=0.5, colorscale=None, name=None, 
-                 legendgroup=None, show_legend=True, axis_labels=None):
+        legendgroup=legendgroup)]
+
+def plot_arrow_tip(point_pair, sizetip=0.5, color='darkblue', name=None, showlegend=False, legendgroup=None,hover_text =None):
     """
-    Plots a 3D line.
+    Plots a vector tip cone from head and tail.
     """
-    x_data=[point_list[i][0] for i in range(len(point_list))]
-    y_data=[point_list[i][1] for i in range(len(point_list))]
-    z_data=[point_list[i][2] for i in range(len(point_list))]
+    return TraceAccumulator(arrow_tip_traces(point_pair, sizetip, color, name, showlegend, legendgroup, hover_text)).figure()
+
+def line_traces(point_list, color='darkblue', width=2, opacity=0.5, colorscale=None, name=None, 
+                legendgroup=None, show_legend=True, axis_labels=None):
+    """
+    Scatter3d line trace (raw dict) through a list of 3D points.
+    """
+    x_data=[float(point_list[i][0]) for i in range(len(point_list))]
+    y_data=[float(point_list[i][1]) for i in range(len(point_list))]
+    z_data=[float(point_list[i][2]) for i in range(len(point_list))]
     
     if axis_labels is None:
         axis_labels = ['x', 'y', 'z']
@@ -185,7 +227,7 @@ def plot_3d_line(point_list, color='darkblue', width=2, opacity=0.5, colorscale=
     else:
         line_dict.update(dict(color=color))
     
-    trace=go.Scatter3d(
+    return [_trace('scatter3d',
         x=x_data, 
         y=y_data, 
         z=z_data,
@@ -197,13 +239,50 @@ def plot_3d_line(point_list, color='darkblue', width=2, opacity=0.5, colorscale=
         hoverinfo='text',
         hovertext=hover_text,
         hoverlabel=dict(bgcolor='white')
-    )
-    
+    )]
+
+def plot_3d_line(point_list, color='darkblue', width=2, opacity=0.5, colorscale=None, name=None, 
+                 legendgroup=None, show_legend=True, axis_labels=None):
+    """
+    Plots a 3D line.
+    """
+    traces = line_traces(point_list, color, width, opacity, colorscale, name, legendgroup, show_legend, axis_labels)
     layout = go.Layout(margin={'l': 0, 'r': 0, 'b': 0, 't': 30})
-    data = [trace]
-    plot_figure = go.Figure(data=data, layout=layout)
+    plot_figure = TraceAccumulator(traces).figure(layout)
     plot_figure.update_layout(title = '3D Line Plot',width=500,height=400,)
     return plot_figure
+
+def lines_from_points_traces(first_pair, *list_pair, size_tip=0.1, colors=None, colors_tip=None,
+                             triad_name=None, axis_labels=None, legendgroup=None, tip_hover_text =None):
+    """
+    Line and arrow tip traces (raw dicts) for a series of 3D point pairs, as one triad.
+    Arguments as in plot_lines_from_points.
+
+    Returns:
+        list: trace dicts, line then tip for each pair.
+    """
+    if colors is None:
+        colors = ['darkblue'] * (len(list_pair) + 1)
+    
+    if colors_tip is None:
+        colors_tip = colors
+        
+    if axis_labels is None:
+        axis_labels = ['x', 'y', 'z']
+    if tip_hover_text is None:
+        tip_hover_text = [f'vec{i}' for i in range(1,len(list_pair) + 2)]
+
+    traces = TraceAccumulator()
+    traces.extend(line_traces(first_pair, color=colors[0], name=triad_name, 
+                              legendgroup=legendgroup, show_legend=False, axis_labels=axis_labels))
+    traces.extend(arrow_tip_traces(first_pair, sizetip=size_tip, color=colors_tip[0], name=triad_name, 
+                                   showlegend=True, legendgroup=legendgroup, hover_text = tip_hover_text[0]))
+    for i, pair in enumerate(list_pair, 1):
+        traces.extend(line_traces(pair, color=colors[i], name=triad_name, 
+                                  legendgroup=legendgroup, show_legend=False, axis_labels=axis_labels))
+        traces.extend(arrow_tip_traces(pair, sizetip=size_tip, color=colors_tip[i], 
+                                       showlegend=False, legendgroup=legendgroup,hover_text = tip_hover_text[i]))
+    return traces.traces
     
 def plot_lines_from_points(first_pair, *list_pair, size_tip=0.1, colors=None, colors_tip=None,
                          triad_name=None, title="3D Vector Plot", axis_labels=None, legendgroup=None, tip_hover_text =None):
@@ -223,53 +302,12 @@ def plot_lines_from_points(first_pair, *list_pair, size_tip=0.1, colors=None, co
     Returns:
         go.Figure.
     """
-    if colors is None:
-        colors = ['darkblue'] * (len(list_pair) + 1)
-    
-    if colors_tip is None:
-        colors_tip = colors
-        
-    if axis_labels is None:
-        axis_labels = ['x', 'y', 'z']
-    if tip_hover_text is None:
-        tip_hover_text = [f'vec{i}' for i in range(1,len(list_pair) + 2)]
-    # print(tip_hover_text)
-    fig1 = plot_3d_line(first_pair, color=colors[0], name=triad_name, 
-                       legendgroup=legendgroup, show_legend=False, axis_labels=axis_labels)
-    
-    fig0 = plot_arrow_tip(first_pair, sizetip=size_tip, color=colors_tip[0], name=triad_name, 
-                         showlegend=True, legendgroup=legendgroup, hover_text = tip_hover_text[0])
-    
-    fig = go.Figure(data=fig1.data + fig0.data)
-    
-    for i, pair in enumerate(list_pair, 1):
-        fig1 = plot_3d_line(pair, color=colors[i], name=triad_name, 
-                           legendgroup=legendgroup, show_legend=False, axis_labels=axis_labels)
-        fig0 = plot_arrow_tip(pair, sizetip=size_tip, color=colors_tip[i], 
-                            showlegend=False, legendgroup=legendgroup,hover_text = tip_hover_text[i])
-        
-        fig2 = go.Figure(data=fig.data + fig1.data + fig0.data)
-        fig = fig2
+    traces = lines_from_points_traces(first_pair, *list_pair, size_tip=size_tip, colors=colors, colors_tip=colors_tip,
+                                      triad_name=triad_name, axis_labels=axis_labels, legendgroup=legendgroup,
+                                      tip_hover_text=tip_hover_text)
+    fig = TraceAccumulator(traces).figure()
 
-    fig.update_layout(
-        margin={'l': 0, 'r': 0, 'b': 0, 't': 30},
-        title=title,
-        width=700,
-        height=400,
-        showlegend=False,
-        legend=dict(
-            yanchor="top",
-            y=0.99,
-            xanchor="right",
-            x=0.99,
-            bgcolor="rgba(255, 255, 255, 0.8)"
-        ),
-        hoverlabel=dict(
-            bgcolor="white",
-            font_size=12,
-            font_family="Arial"
-        )
-    )
+    fig.update_layout(vector_plot_layout(title))
     return fig
 # def plot_lines_from_points(first_pair, *list_pair, size_tip=0.1, colors_line=None,  colors_tip=None, colorscale=None, names=None, title="3D Vector Plot"):
 #     """
@@ -326,6 +364,26 @@ def plot_lines_from_points(first_pair, *list_pair, size_tip=0.1, colors=None, co
 #         )
 #     )
 #     return fig
+def triad_traces(R, rotation_order, Position, colour_triad=['red', 'green', 'blue'], 
+                 colors_arr='magenta', tip_size=0.1, len_triad=1, triad_name = "Coordinate Triad", legendgroup = None):
+    """
+    Line and arrow tip traces (raw dicts) of a coordinate system triad. Arguments as in plot_triad.
+    """
+    R_A, pos = create_rotation_matrix(R, rotation_order, Position)
+    pos = pos.astype(float)
+    # Columns of R_A are the rotated unit axes
+    x, y, z = (R_A*len_triad).T
+
+    list1 = [pos, pos+x]
+    list2 = [pos, pos+y]
+    list3 = [pos, pos+z]
+
+    return lines_from_points_traces(list1, list2, list3, 
+                                    size_tip=tip_size, 
+                                    colors=colour_triad, 
+                                    colors_tip=[colors_arr]*3,
+                                    triad_name=triad_name,  legendgroup = legendgroup, tip_hover_text = ['X','Y','Z'])
+
 def plot_triad(R, rotation_order, Position, colour_triad=['red', 'green', 'blue'], 
                colors_arr='magenta', tip_size=0.1, len_triad=1, triad_name = "Coordinate Triad", legendgroup = None):
     """
@@ -343,42 +401,126 @@ def plot_triad(R, rotation_order, Position, colour_triad=['red', 'green', 'blue'
     Returns:
         go.Figure: Plotly figure object
     """
-    R_A, pos = create_rotation_matrix(R, rotation_order, Position)
-    x = R_A @ np.array([1,0,0])
-    y = R_A @ np.array([0,1,0])
-    z = R_A @ np.array([0,0,1])
-    
-    x = x*len_triad/np.linalg.norm(x)
-    y = y*len_triad/np.linalg.norm(y)
-    z = z*len_triad/np.linalg.norm(z)
-    
-    list1 = [pos, pos+x]
-    list2 = [pos, pos+y]
-    list3 = [pos, pos+z]
-
-    fig = plot_lines_from_points(list1, list2, list3, 
-                               size_tip=tip_size, 
-                               colors=colour_triad, 
-                               colors_tip=[colors_arr]*3,
-                               triad_name=triad_name,  legendgroup = legendgroup, tip_hover_text = ['X','Y','Z'])
-    # legend_color = colors_arr
-    # If a specific legend color is provided, modify traces
-    # if legend_color:
-    #     for trace in fig.data:
-    #         if trace.name == triad_name:
-    #             # Handle Scatter3d traces (lines)
-    #             # if hasattr(trace, 'line'):
-    #             #     trace.line.color = legend_color
-    #             if hasattr(trace, 'marker'):
-    #                 trace.marker.color = legend_color
-                
-    #             # Handle Cone traces (arrow tips)
-    #             if hasattr(trace, 'colorscale'):
-    #                 trace.colorscale = [[0, legend_color], [1, legend_color]]
-    
-    fig.update_layout(scene_aspectmode='data')
+    traces = triad_traces(R, rotation_order, Position, colour_triad, colors_arr, tip_size, len_triad,
+                          triad_name, legendgroup)
+    fig = TraceAccumulator(traces).figure()
+    fig.update_layout(vector_plot_layout(), scene_aspectmode='data')
     return fig
 #---------------------------------------
+# Batched rendering
+def _separated(starts, ends):
+    """x, y, z lists of start->end segments separated by None, for a single Scatter3d"""
+    points = np.empty((len(starts), 3, 3), dtype=object)
+    points[:, 0] = starts
+    points[:, 1] = ends
+    points[:, 2] = None
+    return [points[:, :, k].ravel().tolist() for k in range(3)]
+
+def _per_vertex(values, separator):
+    """Repeats one value per segment for its two vertices, followed by the separator"""
+    return [v for value in values for v in (value, value, separator)]
+
+def _point_hover(name, point):
+    return f"{name}<br>x: {point[0]:.2f}<br>y: {point[1]:.2f}<br>z: {point[2]:.2f}"
+
+class BatchedTraces:
+    """
+    Collects the triads, vectors and connection lines of many systems and renders them as a
+    constant number of traces, whatever the number of systems:
+        one Scatter3d with all axes and vector shafts (None separated, per-segment colors),
+        one Cone with all arrow tips,
+        one dashed Scatter3d with all connection lines.
+    Every segment and tip keeps its own hover text.
+    """
+    def __init__(self):
+        self.segments = []      # (start, end, color, name)
+        self.tips = []          # (tail, head, color, hover_text)
+        self.connections = []   # (start, end, color, name)
+
+    def __len__(self):
+        return len(self.segments) + len(self.connections)
+
+    def add_arrow(self, start, end, color='darkblue', name=None, tip_color=None, tip_hover_text=None):
+        """Line from start to end, with an arrow tip at end if tip_color is given"""
+        start = [float(v) for v in start]
+        end = [float(v) for v in end]
+        self.segments.append((start, end, color, name))
+        if tip_color is not None:
+            self.tips.append((start, end, tip_color, f"{name}<br>{tip_hover_text}" if tip_hover_text else name))
+        return self
+
+    def add_triad(self, R, rotation_order, Position, colour_triad=['red', 'green', 'blue'],
+                  colors_arr='magenta', len_triad=1, triad_name="Coordinate Triad"):
+        """Coordinate system triad, arguments as in plot_triad"""
+        R_A, pos = create_rotation_matrix(R, rotation_order, Position)
+        pos = pos.astype(float)
+        for axis, label, colour in zip((R_A*len_triad).T, 'XYZ', colour_triad):
+            self.add_arrow(pos, pos + axis, colour, triad_name, colors_arr, label)
+        return self
+
+    def add_vector(self, position, vector, color='red', name=None, triad_name=None):
+        """Force or moment vector, arguments as in create_vector"""
+        return self.add_arrow(position, vector_end(position, vector), 'darkblue', triad_name, color, name)
+
+    def add_connection(self, start_point, end_point, color='gray', name=None):
+        """Dashed connection line, as create_connection_line"""
+        self.connections.append(([float(v) for v in start_point], [float(v) for v in end_point], color, name))
+        return self
+
+    def line_trace(self, name='Systems', width=2):
+        starts, ends, colors, names = zip(*self.segments)
+        x, y, z = _separated(starts, ends)
+        hover = [text for n, start, end in zip(names, starts, ends)
+                 for text in (_point_hover(n, start), _point_hover(n, end), '')]
+        return _trace('scatter3d', x=x, y=y, z=z, mode='lines',
+                      line=dict(color=_per_vertex(colors, colors[-1]), width=width),
+                      hoverinfo='text', hovertext=hover, name=name,
+                      legendgroup=name, hoverlabel=dict(bgcolor='white'))
+
+    def tip_trace(self, tip_size=0.2, name='Systems'):
+        """
+        All arrow tips as one Cone trace, each tip_size long. A Cone is colored by vector norm
+        only, so tip k of the color palette gets a norm of 1 + k*eps and a discrete colorscale
+        maps each norm band back to its color (size differences stay below 1%).
+        """
+        tails, heads, colors, hover = zip(*self.tips)
+        heads = np.array(heads)
+        direction = heads - np.array(tails)
+        norm = np.linalg.norm(direction, axis=1, keepdims=True)
+        direction = np.divide(direction, norm, out=np.zeros_like(direction), where=norm > 0)
+
+        palette = list(dict.fromkeys(colors))
+        n_colors = len(palette)
+        eps = min(1e-3, 0.01/n_colors)
+        index = np.array([palette.index(c) for c in colors]) if n_colors > 1 else np.zeros(len(colors))
+        u, v, w = (direction*(1 + eps*index)[:, np.newaxis]).T
+        colorscale = [[(k + edge)/n_colors, color] for k, color in enumerate(palette) for edge in (0, 1)]
+        x, y, z = heads.T
+        return _trace('cone', x=x.tolist(), y=y.tolist(), z=z.tolist(),
+                      u=u.tolist(), v=v.tolist(), w=w.tolist(),
+                      sizemode='absolute', sizeref=tip_size, anchor='tip', showscale=False,
+                      colorscale=colorscale, cmin=1 - eps/2, cmax=1 + (n_colors - 0.5)*eps,
+                      hoverinfo='text', hovertext=list(hover), name=name,
+                      legendgroup=name, showlegend=False)
+
+    def connection_trace(self, name='Connections'):
+        starts, ends, colors, names = zip(*self.connections)
+        x, y, z = _separated(starts, ends)
+        return _trace('scatter3d', x=x, y=y, z=z, mode='lines',
+                      line=dict(color=_per_vertex(colors, colors[-1]), dash='dot', width=2),
+                      hoverinfo='text', hovertext=_per_vertex(names, ''), name=name, showlegend=False)
+
+    def traces(self, tip_size=0.2, name='Systems'):
+        """Trace dicts of everything collected so far, at most three of them"""
+        traces = []
+        if self.segments:
+            traces.append(self.line_trace(name))
+        if self.tips:
+            traces.append(self.tip_trace(tip_size, name))
+        if self.connections:
+            traces.append(self.connection_trace())
+        return traces
+#---------------------------------------
 
 def surf_plot(x_data, y_data, z_data):
     """
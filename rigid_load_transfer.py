@@ -8,14 +8,14 @@
 """
 import numpy as np
 
+from rotation import euler_to_dcm
+
 def create_rotation_matrix(euler_angles, rotation_order, translation):
-    R = np.eye(3)
-    for axis in reversed(rotation_order.lower()):
-        idx = rotation_order.lower().index(axis)
-        angle = euler_angles[idx]
-        R = R @ _axis_rotation(axis, angle)
+    # rotation_order is extrinsic: 'xyz' gives R = Rz @ Ry @ Rx
+    R = euler_to_dcm(euler_angles, rotation_order.lower())
     return R, np.array(translation)
 
+# Reference single-axis rotation, test_rotation.py checks euler_to_dcm against products of these
 def _axis_rotation(axis, angle):
     cos_a = np.cos(angle)
     sin_a = np.sin(angle)
@@ -71,40 +71,297 @@ def combine_loads(loads, target_system):
         total_force: Combined force in target system
         total_moment: Combined moment in target system
     """
-    # Create target system rotation matrix
+    forces, moments, euler_angles, rotation_orders, translations = _stack_loads(loads)
+    return combine_loads_batch(forces, moments, euler_angles, rotation_orders, translations, target_system)
+
+def _stack_loads(loads):
+    """Stacks a list of load dictionaries into (N,3) arrays and a list of rotation orders,
+    a missing force or moment is zero"""
+    forces = np.array([load.get('force', [0, 0, 0]) for load in loads], dtype=float).reshape(-1, 3)
+    moments = np.array([load.get('moment', [0, 0, 0]) for load in loads], dtype=float).reshape(-1, 3)
+    euler_angles = np.array([load['euler_angles'] for load in loads], dtype=float).reshape(-1, 3)
+    rotation_orders = [load['rotation_order'] for load in loads]
+    translations = np.array([load['translation'] for load in loads], dtype=float).reshape(-1, 3)
+    return forces, moments, euler_angles, rotation_orders, translations
+
+def create_rotation_matrices(euler_angles, rotation_orders, translations):
+    """
+    Batched version of create_rotation_matrix for N coordinate systems
+
+    Parameters:
+        euler_angles: (N,3) array of angles in radians
+        rotation_orders: single order (e.g., 'xyz') shared by all systems, or a sequence of N orders
+        translations: (N,3) array of system positions in global system
+
+    Returns:
+        R: (N,3,3) stack of rotation matrices
+        translations: (N,3) array of positions
+    """
+    euler_angles = np.asarray(euler_angles, dtype=float).reshape(-1, 3)
+    translations = np.asarray(translations, dtype=float).reshape(-1, 3)
+    if isinstance(rotation_orders, str):
+        groups = {rotation_orders.lower(): slice(None)}
+    else:
+        orders = np.array([order.lower() for order in rotation_orders])
+        groups = {order: orders == order for order in np.unique(orders)}
+
+    R = np.empty((len(euler_angles), 3, 3))
+    for order, mask in groups.items():
+        R[mask] = euler_to_dcm(euler_angles[mask], order)
+    return R, translations
+
+def combine_loads_batch(forces, moments, euler_angles, rotation_orders, translations, target_system):
+    """
+    Vectorized combine_loads: transfers N loads given as arrays into a target system in one pass
+
+    Parameters:
+        forces: (N,3) local force vectors
+        moments: (N,3) local moment vectors
+        euler_angles: (N,3) source system angles in radians
+        rotation_orders: single order shared by all loads, or a sequence of N orders
+        translations: (N,3) source system positions in global system
+        target_system: Dictionary as in combine_loads
+
+    Returns:
+        total_force: Combined force in target system
+        total_moment: Combined moment in target system
+    """
     R_target, target_pos = create_rotation_matrix(
         target_system['euler_angles'],
         target_system['rotation_order'],
         target_system['translation']
     )
+    R_source, source_pos = create_rotation_matrices(euler_angles, rotation_orders, translations)
 
-    total_force = np.zeros(3)
-    total_moment = np.zeros(3)
-
-    for load in loads:
-        # Create source system rotation matrix
-        R_source, source_pos = create_rotation_matrix(
-            load['euler_angles'],
-            load['rotation_order'],
-            load['translation']
-        )
-
-        # Transfer load to target system
-        F_trans, M_trans = rigid_load_transfer(
-            force_local_A=np.array(load['force']),
-            moment_local_A=np.array(load['moment']),
-            R_A=R_source,
-            point_A_global=source_pos,
-            R_B=R_target,
-            point_B_global=target_pos
-        )
-
-        # Accumulate results
-        total_force += F_trans
-        total_moment += M_trans
+    forces_global = np.einsum('nij,nj->ni', R_source, np.asarray(forces, dtype=float).reshape(-1, 3))
+    moments_global = np.einsum('nij,nj->ni', R_source, np.asarray(moments, dtype=float).reshape(-1, 3))
+    moments_global += np.cross(source_pos - target_pos, forces_global)
 
+    # The projection is linear, so sum in the global system and project once
+    total_force = R_target.T @ forces_global.sum(axis=0)
+    total_moment = R_target.T @ moments_global.sum(axis=0)
     return total_force, total_moment
 
+def _stack_targets(targets):
+    """Stacks a list of target dictionaries into (M,3) arrays and a list of rotation orders"""
+    euler_angles = np.array([target['euler_angles'] for target in targets], dtype=float).reshape(-1, 3)
+    rotation_orders = [target['rotation_order'] for target in targets]
+    translations = np.array([target['translation'] for target in targets], dtype=float).reshape(-1, 3)
+    return euler_angles, rotation_orders, translations
+
+def transfer_loads_to_targets(forces, moments, load_angles, load_orders, load_translations,
+                              target_angles, target_orders, target_translations, return_contributions=False):
+    """
+    Transfers N load systems to M target systems in one call
+
+    Every rotation matrix is built once and the transfer is done with stacked tensor operations.
+
+    Parameters:
+        forces, moments: (N,3) local force and moment vectors
+        load_angles: (N,3) load system angles in radians
+        load_orders: single order shared by all loads, or a sequence of N orders
+        load_translations: (N,3) load system positions in global system
+        target_angles: (M,3) target system angles in radians
+        target_orders: single order shared by all targets, or a sequence of M orders
+        target_translations: (M,3) target system positions in global system
+        return_contributions: also return the per-load contribution tensor
+
+    Returns:
+        resultants: (M,6) table of [Fx, Fy, Fz, Mx, My, Mz] in each target system
+        contributions: (M,N,6) contribution of each load to each target (only if return_contributions)
+    """
+    R_load, load_pos = create_rotation_matrices(load_angles, load_orders, load_translations)
+    R_target, target_pos = create_rotation_matrices(target_angles, target_orders, target_translations)
+    forces_global = np.einsum('nij,nj->ni', R_load, np.asarray(forces, dtype=float).reshape(-1, 3))
+    moments_global = np.einsum('nij,nj->ni', R_load, np.asarray(moments, dtype=float).reshape(-1, 3))
+
+    if return_contributions:
+        r = load_pos[np.newaxis, :, :] - target_pos[:, np.newaxis, :]
+        moments_at_target = moments_global[np.newaxis] + np.cross(r, forces_global[np.newaxis])
+        contributions = np.concatenate([
+            np.einsum('mji,nj->mni', R_target, forces_global),
+            np.einsum('mji,mnj->mni', R_target, moments_at_target)
+        ], axis=-1)
+        return contributions.sum(axis=1), contributions
+
+    # sum(r x F) over loads = sum(p_load x F) - p_target x sum(F), so the O(N) sums are shared by all targets
+    total_force = forces_global.sum(axis=0)
+    total_moment = moments_global.sum(axis=0) + np.cross(load_pos, forces_global).sum(axis=0)
+    moments_at_target = total_moment - np.cross(target_pos, total_force)
+    return np.concatenate([
+        np.einsum('mji,j->mi', R_target, total_force),
+        np.einsum('mji,mj->mi', R_target, moments_at_target)
+    ], axis=-1)
+
+def transfer_systems(loads, targets, degrees=False, return_contributions=False):
+    """
+    transfer_loads_to_targets for lists of load and target dictionaries (as used by combine_loads)
+
+    Parameters:
+        loads: List of load dictionaries
+        targets: List of target system dictionaries
+        degrees: euler_angles are given in degrees (as in load_input.json and the dashboard)
+        return_contributions: also return the (M,N,6) per-load contribution tensor
+
+    Returns:
+        resultants: (M,6) table of [Fx, Fy, Fz, Mx, My, Mz] in each target system
+        contributions: (M,N,6) per-load contributions (only if return_contributions)
+    """
+    forces, moments, load_angles, load_orders, load_translations = _stack_loads(loads)
+    target_angles, target_orders, target_translations = _stack_targets(targets)
+    if degrees:
+        load_angles = np.radians(load_angles)
+        target_angles = np.radians(target_angles)
+    return transfer_loads_to_targets(forces, moments, load_angles, load_orders, load_translations,
+                                     target_angles, target_orders, target_translations,
+                                     return_contributions=return_contributions)
+
+def skew_matrices(vectors):
+    """(...,3,3) cross-product matrices: skew_matrices(r) @ f == np.cross(r, f)"""
+    vectors = np.asarray(vectors, dtype=float)
+    x, y, z = vectors[..., 0], vectors[..., 1], vectors[..., 2]
+    zero = np.zeros_like(x)
+    return np.stack([np.stack([zero, -z, y], axis=-1),
+                     np.stack([z, zero, -x], axis=-1),
+                     np.stack([-y, x, zero], axis=-1)], axis=-2)
+
+def wrench_transformation(R_source, source_pos, R_target, target_pos):
+    """
+    6x6 matrix of rigid_load_transfer: [F_B; M_B] = T @ [F_A; M_A] for local wrenches
+
+        T = | R_B^T R_A               0       |
+            | R_B^T [r]x R_A      R_B^T R_A   |     r = point_A - point_B
+
+    Parameters:
+        R_source, R_target: (...,3,3) rotation matrices (stacks broadcast against each other)
+        source_pos, target_pos: (...,3) positions in global system
+
+    Returns:
+        (...,6,6) transformation matrices
+    """
+    R_source = np.asarray(R_source, dtype=float)
+    R_target = np.asarray(R_target, dtype=float)
+    rotation = np.swapaxes(R_target, -1, -2) @ R_source
+    r = np.asarray(source_pos, dtype=float) - np.asarray(target_pos, dtype=float)
+    coupling = np.swapaxes(R_target, -1, -2) @ skew_matrices(r) @ R_source
+
+    shape = np.broadcast_shapes(rotation.shape, coupling.shape)[:-2]
+    T = np.zeros(shape + (6, 6))
+    T[..., :3, :3] = rotation
+    T[..., 3:, :3] = coupling
+    T[..., 3:, 3:] = rotation
+    return T
+
+def transfer_operators(load_angles, load_orders, load_translations, target_angles, target_orders, target_translations):
+    """
+    6x6 transfer operator of every (target, load) pair
+
+    Transfer is linear in the load wrenches, so once the geometry is fixed the resultants of any
+    load values are contributions = operators @ wrenches, e.g.
+        resultants = np.einsum('mnij,nj->mi', operators, np.hstack([forces, moments]))
+
+    Parameters:
+        load_angles, load_orders, load_translations: load systems, as in transfer_loads_to_targets
+        target_angles, target_orders, target_translations: target systems, as in transfer_loads_to_targets
+
+    Returns:
+        (M,N,6,6) operators mapping local [F; M] of load n to its contribution in target m
+    """
+    R_load, load_pos = create_rotation_matrices(load_angles, load_orders, load_translations)
+    R_target, target_pos = create_rotation_matrices(target_angles, target_orders, target_translations)
+    return wrench_transformation(R_load[np.newaxis], load_pos[np.newaxis],
+                                 R_target[:, np.newaxis], target_pos[:, np.newaxis])
+
+def transfer_operators_systems(loads, targets, degrees=False):
+    """
+    transfer_operators for lists of load and target dictionaries (force and moment may be omitted)
+
+    Returns:
+        (M,N,6,6) operators, see transfer_operators
+    """
+    # Only the frames are needed, and loads share those keys with targets
+    load_angles, load_orders, load_translations = _stack_targets(loads)
+    target_angles, target_orders, target_translations = _stack_targets(targets)
+    if degrees:
+        load_angles = np.radians(load_angles)
+        target_angles = np.radians(target_angles)
+    return transfer_operators(load_angles, load_orders, load_translations,
+                              target_angles, target_orders, target_translations)
+
+def _frame_key(frame):
+    """Hashable snapshot of a frame's orientation and position"""
+    return (tuple(np.asarray(frame['euler_angles'], dtype=float).ravel()), frame['rotation_order'].lower(),
+            tuple(np.asarray(frame['translation'], dtype=float).ravel()))
+
+class TransferOperator:
+    """
+    Cached 6x6 wrench transformation from a source frame to a target frame
+
+    The matrix (see wrench_transformation) is built on first use and kept until the orientation or
+    position of either frame changes, so a fixed geometry costs one matmul per application
+    whatever the number of wrenches:
+        op = TransferOperator(load, target, degrees=True)
+        history_B = op.apply(history_A)     # (T,6) local wrenches [F; M] -> (T,6) in the target
+        load['euler_angles'][2] += 5        # the next apply rebuilds the matrix
+
+    Parameters:
+        source: Source frame dictionary ('euler_angles', 'rotation_order', 'translation'), e.g. a load
+        target: Target frame dictionary
+        degrees: euler_angles are given in degrees
+    """
+    def __init__(self, source, target, degrees=False):
+        self.source = source
+        self.target = target
+        self.degrees = degrees
+        self._key = None
+        self._matrix = None
+
+    def __repr__(self):
+        state = 'cached' if self._matrix is not None else 'not built'
+        return f"TransferOperator(source={self.source!r}, target={self.target!r}, {state})"
+
+    def _rotation(self, frame):
+        angles = np.asarray(frame['euler_angles'], dtype=float)
+        if self.degrees:
+            angles = np.radians(angles)
+        return create_rotation_matrix(angles, frame['rotation_order'], frame['translation'])
+
+    def invalidate(self):
+        """Drops the cached matrix"""
+        self._key = None
+        self._matrix = None
+
+    @property
+    def matrix(self):
+        """(6,6) transformation, rebuilt only if a frame moved since it was cached"""
+        key = (_frame_key(self.source), _frame_key(self.target), self.degrees)
+        if key != self._key:
+            R_source, source_pos = self._rotation(self.source)
+            R_target, target_pos = self._rotation(self.target)
+            self._matrix = wrench_transformation(R_source, source_pos, R_target, target_pos)
+            self._key = key
+        return self._matrix
+
+    def apply(self, wrenches):
+        """
+        Transfers local source wrenches to the target frame
+
+        Parameters:
+            wrenches: (6,) wrench [Fx, Fy, Fz, Mx, My, Mz] or (T,6) history of wrenches
+
+        Returns:
+            wrenches in the target frame, same shape as the input
+        """
+        wrenches = np.asarray(wrenches, dtype=float)
+        if wrenches.shape[-1] != 6:
+            raise ValueError(f"Expected wrenches of shape (6,) or (T,6), got {wrenches.shape}")
+        return wrenches @ self.matrix.T
+
+    def transfer(self, force, moment):
+        """(force, moment) in the target frame, as rigid_load_transfer"""
+        result = self.apply(np.concatenate([force, moment]))
+        return result[:3], result[3:]
+
 # Example usage
 if __name__ == "__main__":
     # Define target system (lc0)
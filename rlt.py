@@ -7,15 +7,16 @@
 
 """
 import dash
-from dash import dcc, html, Input, Output, State, callback, dash_table, ALL
-import plotly.graph_objects as go
+from dash import dcc, html, Input, Output, State, callback, dash_table, MATCH, Patch, set_props
 import numpy as np
 import json
+import hashlib
 import base64
 import io
 # import dash_daq as daq
 import plot_3d as plot3d
 import rigid_load_transfer as rlt
+import load_case_io
 
 # ---------------------------------------- THEMES ----------------------------------------
 PLOT_THEMES = {
@@ -50,6 +51,18 @@ PLOT_THEMES = {
         'text_color': '#4682B4'
     }
 }
+# 'auto' render mode switches to batched traces above this many systems (loads + targets)
+BATCH_THRESHOLD = 50
+# ... and to level-of-detail rendering above this many (default of the LOD threshold input)
+LOD_THRESHOLD = 500
+# Level of detail: force and moment vectors drawn for the K largest magnitudes only
+LOD_TOP_K = 20
+# Systems per page of the input panel, only the visible page is rendered
+PANEL_PAGE_SIZE = 25
+# pending-edits when nothing is held back
+NO_EDITS = {'load': {}, 'target': {}}
+# Debounced edit mode: seconds of typing pause before an input value is sent
+EDIT_DEBOUNCE = 0.5
 # --------------------------------- Initialize Dash app ----------------------------------
 # Initialize Dash app
 app = dash.Dash(__name__, suppress_callback_exceptions=True)
@@ -66,6 +79,18 @@ app.layout = html.Div([
     
     dcc.Store(id='loads-store', data=[]),
     dcc.Store(id='targets-store', data=[]),
+    dcc.Store(id='figure-state', data=None),
+    # Systems drawn in full detail in level-of-detail mode: [['load', i], ['target', j], ...]
+    dcc.Store(id='detail-systems', data=[]),
+    dcc.Store(id='results-store', data=None),
+    # Hashes of the rendered results table rows, so the table itself never goes back to the server
+    dcc.Store(id='results-rows', data=None),
+    # Bumped when the input panel must be re-rendered (systems added, file uploaded, edits discarded)
+    dcc.Store(id='panel-revision', data=0),
+    # Field edits held back in 'apply' mode: {'load': {index: {field: value}}, 'target': {...}}
+    dcc.Store(id='pending-edits', data=NO_EDITS),
+    # Page of the input panel shown for loads and targets
+    dcc.Store(id='panel-pages', data={'load': 0, 'target': 0}),
     dcc.Download(id="download-data"), 
     html.Div([
         html.Div([
@@ -83,6 +108,20 @@ app.layout = html.Div([
                     'fontSize': '16px',
                     'marginBottom': '10px'
                 }),multiple=False,),
+
+            html.Div([
+                html.Label("Edits:"),
+                dcc.RadioItems(
+                    id='edit-mode',
+                    options=[
+                        {'label': 'Live', 'value': 'live'},
+                        {'label': 'Debounced', 'value': 'debounce'},
+                        {'label': 'Apply', 'value': 'apply'}
+                    ], value='debounce', inline=True, inputStyle={'marginRight': '4px', 'marginLeft': '8px'}
+                ),
+                html.Button('✔ Apply', id='apply-edits-btn', n_clicks=0, disabled=True),
+                html.Button('✖ Discard', id='discard-edits-btn', n_clicks=0, disabled=True)
+            ], style={'display': 'flex', 'alignItems': 'center', 'gap': '5px', 'flexWrap': 'wrap', 'marginBottom': '10px'}),
                        
             html.Button('➕ Add Load System', id='add-load-btn', n_clicks=0, style={
                 'width': '100%', 
@@ -94,6 +133,11 @@ app.layout = html.Div([
                 'cursor': 'pointer',
                 'fontSize': '16px'
             }),
+            html.Div([
+                html.Button('◀', id='load-prev-btn', n_clicks=0),
+                html.Span(id='load-page-label', style={'fontSize': '13px'}),
+                html.Button('▶', id='load-next-btn', n_clicks=0)
+            ], style={'display': 'flex', 'alignItems': 'center', 'justifyContent': 'space-between', 'marginTop': '10px'}),
             html.Div(id='load-inputs-container', style={'marginTop': '10px'}),
             html.Hr(style={'border': '1px solid #ccc'}),
 
@@ -107,6 +151,11 @@ app.layout = html.Div([
                 'cursor': 'pointer',
                 'fontSize': '16px'
             }),
+            html.Div([
+                html.Button('◀', id='target-prev-btn', n_clicks=0),
+                html.Span(id='target-page-label', style={'fontSize': '13px'}),
+                html.Button('▶', id='target-next-btn', n_clicks=0)
+            ], style={'display': 'flex', 'alignItems': 'center', 'justifyContent': 'space-between', 'marginTop': '10px'}),
             html.Div(id='target-inputs-container', style={'marginTop': '10px'}),
             
             # Add the export button to your layout (in the input systems section)
@@ -155,6 +204,28 @@ app.layout = html.Div([
                 )
             ], style={'display': 'flex','alignItems': 'center','justifyContent': 'flex-end','padding': '10px 20px'
             }),
+            html.Div([
+                html.Label("Rendering:", style={'marginRight': '10px'}),
+                dcc.RadioItems(
+                    id='render-mode',
+                    options=[
+                        {'label': 'Auto', 'value': 'auto'},
+                        {'label': 'Per system', 'value': 'systems'},
+                        {'label': 'Batched', 'value': 'batched'},
+                        {'label': 'Level of detail', 'value': 'lod'}
+                    ], value='auto', inline=True, inputStyle={'marginRight': '4px', 'marginLeft': '8px'}
+                )
+            ], style={'display': 'flex','alignItems': 'center','justifyContent': 'flex-end','padding': '0px 20px'
+            }),
+            html.Div([
+                html.Label("LOD above", title='Auto mode switches to level of detail above this many systems'),
+                dcc.Input(id='lod-threshold', type='number', min=1, value=LOD_THRESHOLD, debounce=True, style={'width': '60px'}),
+                html.Label("Top K", title='Vectors drawn for the K largest forces and moments'),
+                dcc.Input(id='lod-top-k', type='number', min=0, value=LOD_TOP_K, debounce=True, style={'width': '50px'}),
+                html.Button('Clear detail', id='clear-detail-btn', n_clicks=0,
+                            title='Click a system origin in the plot to show it in full detail')
+            ], style={'display': 'flex','alignItems': 'center','justifyContent': 'flex-end','gap': '5px','padding': '5px 20px'
+            }),
         #---------------------------------------------------------------------------------------------------
         ], style={
             'width': '25%', 
@@ -175,7 +246,13 @@ app.layout = html.Div([
                 'backgroundColor': 'white',
                 'padding': '10px'
             }),
-            html.Div(id='results-container', style={
+            html.Div([
+                dash_table.DataTable(
+                    id='results-table',
+                    columns=[{'name': col, 'id': col} for col in ['System', 'Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz']],
+                    data=[]
+                )
+            ], id='results-container', style={
                 'height': '20%',
                 'marginTop': '10px', 
                 'padding': '10px', 
@@ -187,6 +264,12 @@ app.layout = html.Div([
     ], style={'display': 'flex', 'justifyContent': 'space-between', 'gap': '20px', 'padding': '20px'})
 ])
 # ---------------------------------------- Callbacks ----------------------------------------
+def bump_panel_revision():
+    """Makes update_input_components re-render the input panel"""
+    revision = Patch()
+    revision += 1
+    set_props('panel-revision', {'data': revision})
+
 # Callbacks for adding systems
 @app.callback(
     Output('loads-store', 'data'),
@@ -204,6 +287,7 @@ def add_load_system(n_clicks, data):
         'translation': [0.0, 0.0, 0.0],
         'color': {'hex': f'#{np.random.randint(0, 0xFFFFFF):06x}'}
     }
+    bump_panel_revision()
     return data + [new_load]
 
 @app.callback(
@@ -220,19 +304,75 @@ def add_target_system(n_clicks, data):
         'translation': [0.0, 0.0, 0.0],
         'color': {'hex': f'#{np.random.randint(0, 0xFFFFFF):06x}'}
     }
+    bump_panel_revision()
     return data + [new_target]
 
+# Input panel paging
+@app.callback(
+    Output('panel-pages', 'data'),
+    [Input('load-prev-btn', 'n_clicks'),
+     Input('load-next-btn', 'n_clicks'),
+     Input('target-prev-btn', 'n_clicks'),
+     Input('target-next-btn', 'n_clicks')],
+    State('panel-pages', 'data'),
+    prevent_initial_call=True
+)
+def change_page(load_prev, load_next, target_prev, target_next, pages):
+    input_type, direction = dash.callback_context.triggered_id.split('-')[:2]
+    pages = dict(pages)
+    # The upper bound is applied by update_input_components, which knows the system counts
+    pages[input_type] = max(0, pages[input_type] + (1 if direction == 'next' else -1))
+    return pages
+
+def page_range(n_items, page):
+    """(start, stop, page) of a page, clamped to the last page"""
+    last_page = max(0, (n_items - 1)//PANEL_PAGE_SIZE)
+    page = min(max(0, page), last_page)
+    start = page*PANEL_PAGE_SIZE
+    return start, min(start + PANEL_PAGE_SIZE, n_items), page
+
+def prune_edits(pending, counts):
+    """Drops pending edits of systems that no longer exist (e.g. after loading a shorter file)"""
+    kept = {input_type: {index: fields for index, fields in edits.items() if int(index) < counts[input_type]}
+            for input_type, edits in pending.items()}
+    if kept != pending:
+        dropped = sum(len(pending[t]) - len(kept[t]) for t in pending)
+        print(f"Dropped pending edits of {dropped} system(s) that no longer exist")
+        set_props('pending-edits', {'data': kept})
+    return kept
+
 # Input components callback
+# Re-renders the controls only when the structure changes (panel-revision), the edit mode or the page changes,
+# value edits update the stores and leave the rendered inputs alone.
+# Only PANEL_PAGE_SIZE systems per list are rendered, so the layout stays bounded for thousands of systems.
 @app.callback(
     [Output('load-inputs-container', 'children'),
-     Output('target-inputs-container', 'children')],
-    [Input('loads-store', 'data'),
-     Input('targets-store', 'data')]
+     Output('target-inputs-container', 'children'),
+     Output('load-page-label', 'children'),
+     Output('target-page-label', 'children')],
+    [Input('panel-revision', 'data'),
+     Input('edit-mode', 'value'),
+     Input('panel-pages', 'data')],
+    [State('loads-store', 'data'),
+     State('targets-store', 'data'),
+     State('pending-edits', 'data')]
 )
-def update_input_components(loads, targets):
+def update_input_components(revision, edit_mode, pages, loads, targets, pending):
+    # 'apply' sends values on blur or Enter, they are held in pending-edits until applied
+    debounce = {'live': False, 'debounce': EDIT_DEBOUNCE}.get(edit_mode, True)
+    # Pending edits survive re-renders (page turns, added systems, uploads, edit-mode switches) and are
+    # shown on the inputs they belong to, only Discard clears them
+    pending = prune_edits(pending or NO_EDITS, {'load': len(loads), 'target': len(targets)})
+    clamped = {'load': page_range(len(loads), pages['load'])[2],
+               'target': page_range(len(targets), pages['target'])[2]}
+    if clamped != pages:
+        set_props('panel-pages', {'data': clamped})
+
     def create_controls(items, input_type):
+        start, stop, page = page_range(len(items), clamped[input_type])
         controls = []
-        for i, item in enumerate(items):
+        for i in range(start, stop):
+            item = dict(items[i], **pending[input_type].get(str(i), {}))
             # Handle legacy color format
             if isinstance(item['color'], str):
                 item['color'] = {'hex': item['color']}
@@ -246,18 +386,18 @@ def update_input_components(loads, targets):
                         html.Label("System Name:"),
                         dcc.Input(
                             value=item.get('name', f'{input_type.capitalize()} System {i+1}'),
-                            type='text',
+                            type='text', debounce=debounce,
                             id={'type': 'name', 'index': i, 'input-type': input_type},
                             style={'width': '200px'})
                     ], style={'marginBottom': '10px'}),
                         
                     html.Div([
                         html.Label("Position(X,Y,Z):"),
-                        dcc.Input(value=item['translation'][0], type='number',
+                        dcc.Input(value=item['translation'][0], type='number', debounce=debounce,
                                  id={'type': 'tx', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                        dcc.Input(value=item['translation'][1], type='number',
+                        dcc.Input(value=item['translation'][1], type='number', debounce=debounce,
                                  id={'type': 'ty', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                        dcc.Input(value=item['translation'][2], type='number',
+                        dcc.Input(value=item['translation'][2], type='number', debounce=debounce,
                                  id={'type': 'tz', 'index': i, 'input-type': input_type},style={'width': '50px'}),
                     ], className='input-group',style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'}),
                     # html.Hr(),
@@ -279,11 +419,11 @@ def update_input_components(loads, targets):
                         html.Div([
                             html.Label("Rotation (deg):", style={'minWidth': '100px'}),
                             html.Div([  # Container for inputs
-                                dcc.Input(value=np.array(item['euler_angles'][0]), type='number',
+                                dcc.Input(value=np.array(item['euler_angles'][0]), type='number', debounce=debounce,
                                          id={'type': 'rx', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                                dcc.Input(value=np.array(item['euler_angles'][1]), type='number',
+                                dcc.Input(value=np.array(item['euler_angles'][1]), type='number', debounce=debounce,
                                          id={'type': 'ry', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                                dcc.Input(value=np.array(item['euler_angles'][2]), type='number',
+                                dcc.Input(value=np.array(item['euler_angles'][2]), type='number', debounce=debounce,
                                          id={'type': 'rz', 'index': i, 'input-type': input_type},style={'width': '50px'}),
                             ], style={'display': 'flex', 'gap': '5px'})
                         ], style={'display': 'flex', 'alignItems': 'center', 'gap': '10px'})
@@ -292,21 +432,21 @@ def update_input_components(loads, targets):
                         
                     html.Div([
                         html.Label("Force (X,Y,Z):"),
-                        dcc.Input(value=item.get('force', [0,0,0])[0], type='number',
+                        dcc.Input(value=item.get('force', [0,0,0])[0], type='number', debounce=debounce,
                                  id={'type': 'fx', 'index': i, 'input-type': input_type}, style={'width': '50px'}),
-                        dcc.Input(value=item.get('force', [0,0,0])[1], type='number',
+                        dcc.Input(value=item.get('force', [0,0,0])[1], type='number', debounce=debounce,
                                  id={'type': 'fy', 'index': i, 'input-type': input_type}, style={'width': '50px'}),
-                        dcc.Input(value=item.get('force', [0,0,0])[2], type='number',
+                        dcc.Input(value=item.get('force', [0,0,0])[2], type='number', debounce=debounce,
                                  id={'type': 'fz', 'index': i, 'input-type': input_type}, style={'width': '50px'}),
                     ], className='input-group', style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'}) if input_type == 'load' else html.Div(hidden=True),
                         
                     html.Div([
                         html.Label("Moment (X,Y,Z):"),
-                        dcc.Input(value=item.get('moment', [0,0,0])[0], type='number',
+                        dcc.Input(value=item.get('moment', [0,0,0])[0], type='number', debounce=debounce,
                                  id={'type': 'mx', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                        dcc.Input(value=item.get('moment', [0,0,0])[1], type='number',
+                        dcc.Input(value=item.get('moment', [0,0,0])[1], type='number', debounce=debounce,
                                  id={'type': 'my', 'index': i, 'input-type': input_type},style={'width': '50px'}),
-                        dcc.Input(value=item.get('moment', [0,0,0])[2], type='number',
+                        dcc.Input(value=item.get('moment', [0,0,0])[2], type='number', debounce=debounce,
                                  id={'type': 'mz', 'index': i, 'input-type': input_type},style={'width': '50px'}),
                     ], className='input-group', style={'display': 'flex', 'alignItems': 'center', 'gap': '5px'}) if input_type == 'load' else html.Div(hidden=True)
                 ], style={
@@ -319,342 +459,532 @@ def update_input_components(loads, targets):
             )
         return controls
 
-    return create_controls(loads, 'load'), create_controls(targets, 'target')
-# Input updates callback
+    def page_label(items, input_type):
+        start, stop, page = page_range(len(items), clamped[input_type])
+        return f"{input_type.capitalize()}s {start + 1 if items else 0}–{stop} of {len(items)}"
 
+    return (create_controls(loads, 'load'), create_controls(targets, 'target'),
+            page_label(loads, 'load'), page_label(targets, 'target'))
+# Input updates callbacks
+# Store field edited by each group of input components: one value, or an (x, y, z) vector
+INPUT_FIELDS = {
+    'name': ('name',),
+    'translation': ('tx', 'ty', 'tz'),
+    'euler_angles': ('rx', 'ry', 'rz'),
+    'force': ('fx', 'fy', 'fz'),
+    'moment': ('mx', 'my', 'mz'),
+    'rotation_order': ('rot-order',)
+}
+STORE_IDS = {'load': 'loads-store', 'target': 'targets-store'}
+
+def input_number(value):
+    # Handle null/empty values for numeric inputs
+    return 0.0 if value is None or value == '' else float(value)
+
+def register_field_callback(field, types):
+    """
+    One MATCH callback per field: an edit sends only the inputs of that field of that system
+    and patches that single field of the store, whatever the number of systems.
+    In 'apply' edit mode the value goes to pending-edits instead.
+    """
+    @app.callback(
+        *[Input({'type': value_type, 'index': MATCH, 'input-type': MATCH}, 'value') for value_type in types],
+        State('edit-mode', 'value'),
+        prevent_initial_call=True
+    )
+    def update_field(*values):
+        *values, edit_mode = values
+        component_id = json.loads(dash.callback_context.triggered[0]['prop_id'].rsplit('.', 1)[0])
+        value = values[0] if len(types) == 1 else [input_number(v) for v in values]
+        patch = Patch()
+        if edit_mode == 'apply':
+            patch[component_id['input-type']][str(component_id['index'])][field] = value
+            set_props('pending-edits', {'data': patch})
+        else:
+            patch[component_id['index']][field] = value
+            set_props(STORE_IDS[component_id['input-type']], {'data': patch})
+    return update_field
+
+for field, types in INPUT_FIELDS.items():
+    register_field_callback(field, types)
+
+# Apply mode: all pending edits reach the stores in one update, so they cause one recompute
 @app.callback(
     [Output('loads-store', 'data', allow_duplicate=True),
-     Output('targets-store', 'data', allow_duplicate=True)],
-    [Input({'type': 'name', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'tx', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'ty', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'tz', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'rx', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'ry', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'rz', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'fx', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'fy', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'fz', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'mx', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'my', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'mz', 'index': ALL, 'input-type': ALL}, 'value'),
-     Input({'type': 'rot-order', 'index': ALL, 'input-type': ALL}, 'value')],
-    [State('loads-store', 'data'),
-     State('targets-store', 'data')],
+     Output('targets-store', 'data', allow_duplicate=True),
+     Output('pending-edits', 'data')],
+    Input('apply-edits-btn', 'n_clicks'),
+    State('pending-edits', 'data'),
     prevent_initial_call=True
 )
-def update_stores(name,tx, ty, tz, rx, ry, rz, 
-                 fx, fy, fz, mx, my, mz, rot_orders,
-                 loads, targets):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        return loads, targets
-
-    # Create dictionaries to store all input values by their type and index
-    input_values = {'load': {}, 'target': {}}
-
-    # Get the triggered input info
-    triggered = [t['prop_id'] for t in ctx.triggered]
-    
-    # Process all inputs
-    for trigger_idx, trigger in enumerate(triggered):
-        # Parse the triggered component ID
-        if '.' in trigger:  # Ensure it's a valid trigger
-            component_id = trigger.split('.')[0]
-            try:
-                parsed_id = eval(component_id)
-                input_type = parsed_id['input-type']
-                index = parsed_id['index']
-                value_type = parsed_id['type']
-                
-                # Initialize nested dictionaries if they don't exist
-                if index not in input_values[input_type]:
-                    input_values[input_type][index] = {}
-                
-                # Get the corresponding value from the triggered input
-                value = ctx.triggered[trigger_idx]['value']
-                # Handle null/empty values for numeric inputs
-                if value_type in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'fx', 'fy', 'fz', 'mx', 'my', 'mz']:
-                    value = 0.0 if value is None or value == '' else float(value)
-                # input_values[input_type][index][value_type] = value
-                input_values[input_type][index][value_type] = value
-                
-            except Exception as e:
-                print(f"Error processing trigger {trigger}: {e}")
-                continue
+def apply_edits(n_clicks, pending):
+    stores = []
+    for input_type in ('load', 'target'):
+        edits = pending.get(input_type, {})
+        if not edits:
+            stores.append(dash.no_update)
+            continue
+        patch = Patch()
+        for index, fields in edits.items():
+            for field, value in fields.items():
+                patch[int(index)][field] = value
+        stores.append(patch)
+    return stores[0], stores[1], NO_EDITS
 
-    # Update loads
-    for i in range(len(loads)):
-        if i in input_values.get('load', {}):
-            vals = input_values['load'][i]
-            
-            if 'name' in vals:
-                loads[i]['name'] = vals['name']            
-            # Update translation
-            if any(k in vals for k in ['tx', 'ty', 'tz']):
-                loads[i]['translation'] = [
-                    vals.get('tx', loads[i]['translation'][0]),
-                    vals.get('ty', loads[i]['translation'][1]),
-                    vals.get('tz', loads[i]['translation'][2])
-                ]
-            
-            # Update rotation angles
-            if any(k in vals for k in ['rx', 'ry', 'rz']):
-                loads[i]['euler_angles'] = np.array([
-                    vals.get('rx', loads[i]['euler_angles'][0]),
-                    vals.get('ry', loads[i]['euler_angles'][1]),
-                    vals.get('rz', loads[i]['euler_angles'][2])
-                ]).tolist()
-            
-            # Update force
-            if any(k in vals for k in ['fx', 'fy', 'fz']):
-                loads[i]['force'] = [
-                    vals.get('fx', loads[i]['force'][0]),
-                    vals.get('fy', loads[i]['force'][1]),
-                    vals.get('fz', loads[i]['force'][2])
-                ]
-            
-            # Update moment
-            if any(k in vals for k in ['mx', 'my', 'mz']):
-                loads[i]['moment'] = [
-                    vals.get('mx', loads[i]['moment'][0]),
-                    vals.get('my', loads[i]['moment'][1]),
-                    vals.get('mz', loads[i]['moment'][2])
-                ]
-            
-            # Update rotation order
-            if 'rot-order' in vals:
-                loads[i]['rotation_order'] = vals['rot-order']
-
-    # Update targets
-    for i in range(len(targets)):
-        if i in input_values.get('target', {}):
-            vals = input_values['target'][i]
-            if 'name' in vals:
-                targets[i]['name'] = vals['name']       
-            # Update translation
-            if any(k in vals for k in ['tx', 'ty', 'tz']):
-                targets[i]['translation'] = [
-                    vals.get('tx', targets[i]['translation'][0]),
-                    vals.get('ty', targets[i]['translation'][1]),
-                    vals.get('tz', targets[i]['translation'][2])
-                ]
-            
-            # Update rotation angles
-            if any(k in vals for k in ['rx', 'ry', 'rz']):
-                targets[i]['euler_angles'] = np.array([
-                    vals.get('rx', targets[i]['euler_angles'][0]),
-                    vals.get('ry', targets[i]['euler_angles'][1]),
-                    vals.get('rz', targets[i]['euler_angles'][2])
-                ]).tolist()
-            
-            # Update rotation order
-            if 'rot-order' in vals:
-                targets[i]['rotation_order'] = vals['rot-order']
-
-    return loads, targets
-# Visualization callback
 @app.callback(
-    [Output('3d-plot', 'figure'),
-     Output('results-container', 'children')],
-    [Input('loads-store', 'data'),
-     Input('targets-store', 'data'),
-     Input('theme-selector', 'value')]
+    Input('discard-edits-btn', 'n_clicks'),
+    prevent_initial_call=True
 )
-def update_visualization(loads, 
-                         targets, 
-                         # template,
-                         theme):
-    fig = go.Figure()
-    results = []
-    theme_colors = PLOT_THEMES[theme]
-    # Add global system
-    fig.add_trace(go.Scatter3d(x=[0], y=[0], z=[0], mode='markers',
-                              marker=dict(size=4, color='black'), name='Global'))
-
-    # Process loads
-    for i, load in enumerate(loads):
-        try:
-            load_name = load.get('name', f'Load System {i+1}')
-            if isinstance(load['color'], str):  # Handle legacy format
-                load['color'] = {'hex': load['color']}
-
-            R, pos = rlt.create_rotation_matrix(
-                np.radians(load['euler_angles']),
-                # np.array(load['euler_angles']),
-                load['rotation_order'],
-                load['translation']
-            )
-            color = load['color']['hex']
-
-            # Add coordinate system
-            fig_load = plot3d.plot_triad(np.radians(load['euler_angles']), 
-                                         load['rotation_order'],
-                                         load['translation'], 
-                                         tip_size = 0.5, len_triad = 1,colors_arr = color,
-                                         triad_name = f"{load_name}:InputCSYS", legendgroup= f'group{i}')
-            fig = go.Figure(data = fig.data + fig_load.data)
-            # fig.add_traces(create_triad(pos, R, color))
-
-            # Add vectors
-            if 'force' in load:
-                fig_force = plot3d.create_vector(pos, R @ load['force'], color, f'Force:{load['force']}', legendgroup= f'force_group{i}',triad_name = f"{load_name}:Force")
-                fig = go.Figure(data = fig.data + fig_force.data)
-            if 'moment' in load:
-                # fig.add_trace(create_vector(pos, R @ load['moment'], color, f'Load {i+1} Moment'))
-                fig_mom  = plot3d.create_vector(pos, R @ load['moment'], color, f'Moment:{load['moment']}', legendgroup= f'force_group{i}',triad_name = f"{load_name}:Moment")
-                fig = go.Figure(data = fig.data + fig_mom.data)
-                
-            # Add connection lines to all targets
-            for j, target in enumerate(targets):
-                # Create a slightly lighter version of the load color for the connection line
-                line_color = color  # You can also create a lighter shade if desired  
-                # Add connection line
-                fig.add_trace(plot3d.create_connection_line(load['translation'],target['translation'],line_color))
-        except Exception as e:
-            print(f"Error processing load {i}: {e}")
+def discard_edits(n_clicks):
+    # Re-rendering the panel from the stores without the pending edits
+    set_props('pending-edits', {'data': NO_EDITS})
+    bump_panel_revision()
 
-    # Process targets
-    for i, target in enumerate(targets):
-        try:
-            target_name = target.get('name', f'Target {i+1}')
-            if isinstance(target['color'], str):  # Handle legacy format
-                target['color'] = {'hex': target['color']}
-            # target_name = load.get('name', f'Load System {i+1}')
-            R_target, pos_target = rlt.create_rotation_matrix(
-                np.radians(target['euler_angles']),
-                # np.array(target['euler_angles']),
-                target['rotation_order'],
-                target['translation']
-            )
-            color = target['color']['hex']
-
-            # Add coordinate system
-            fig_load = plot3d.plot_triad(np.radians(target['euler_angles']), 
-                                         target['rotation_order'],
-                                         target['translation'], 
-                                         tip_size = 0.5, len_triad = 1,colors_arr = color,
-                                         triad_name = f"{target_name}:OutCSYS", legendgroup= f'Out_group{i}')
-            fig = go.Figure(data = fig.data + fig_load.data)
-            
-            # fig.add_traces(create_triad(pos_target, R_target, color))
-
-            # Calculate results
-            total_F, total_M = np.zeros(3), np.zeros(3)
-            for load in loads:
-                R_load, pos_load = rlt.create_rotation_matrix(
-                    np.radians(load['euler_angles']),
-                    # np.array(load['euler_angles']),
-                    load['rotation_order'],
-                    load['translation']
-                )
-                F, M = rlt.rigid_load_transfer(
-                    np.array(load['force']),
-                    np.array(load['moment']),
-                    R_load, pos_load,
-                    R_target, pos_target
-                )
-                total_F += F
-                total_M += M
+app.clientside_callback(
+    """
+    function(pending) {
+        const empty = !pending || Object.values(pending).every(edits => Object.keys(edits).length === 0);
+        return [empty, empty];
+    }
+    """,
+    [Output('apply-edits-btn', 'disabled'),
+     Output('discard-edits-btn', 'disabled')],
+    Input('pending-edits', 'data')
+)
+# ---------------------------------------- Figure helpers ----------------------------------------
+def system_hash(item):
+    """Stable content hash of a load or target dict"""
+    return hashlib.sha1(json.dumps(item, sort_keys=True).encode()).hexdigest()[:16]
 
-            results.append({
-                # 'System': f'Target {i+1}',
-                'System': target.get('name', f'Target {i+1}'),
-                'Fx': f"{total_F[0]:.2f}", 'Fy': f"{total_F[1]:.2f}", 'Fz': f"{total_F[2]:.2f}",
-                'Mx': f"{total_M[0]:.2f}", 'My': f"{total_M[1]:.2f}", 'Mz': f"{total_M[2]:.2f}"
-            })
+def system_rotation(item):
+    """Rotation matrix of a load or target dict (angles in degrees)"""
+    return rlt.create_rotation_matrix(np.radians(item['euler_angles']), item['rotation_order'], [0, 0, 0])[0]
 
-        except Exception as e:
-            print(f"Error processing target {i}: {e}")
-
-    # Configure plot
-    # Update layout with theme
-    fig.update_layout(
+def theme_layout(theme):
+    theme_colors = PLOT_THEMES[theme]
+    axis = dict(
+        backgroundcolor=theme_colors['bg_color'],
+        gridcolor=theme_colors['grid_color'],
+        showbackground=True,
+        zerolinecolor=theme_colors['grid_color'],
+        color=theme_colors['text_color']
+    )
+    return dict(
         paper_bgcolor=theme_colors['bg_color'],
         plot_bgcolor=theme_colors['bg_color'],
         scene=dict(
-            xaxis=dict(
-                title='X',
-                backgroundcolor=theme_colors['bg_color'],
-                gridcolor=theme_colors['grid_color'],
-                showbackground=True,
-                zerolinecolor=theme_colors['grid_color'],
-                color=theme_colors['text_color']
-            ),
-            yaxis=dict(
-                title='Y',
-                backgroundcolor=theme_colors['bg_color'],
-                gridcolor=theme_colors['grid_color'],
-                showbackground=True,
-                zerolinecolor=theme_colors['grid_color'],
-                color=theme_colors['text_color']
-            ),
-            zaxis=dict(
-                title='Z',
-                backgroundcolor=theme_colors['bg_color'],
-                gridcolor=theme_colors['grid_color'],
-                showbackground=True,
-                zerolinecolor=theme_colors['grid_color'],
-                color=theme_colors['text_color']
-            ),
-            aspectmode='cube',
+            xaxis=dict(title='X', **axis),
+            yaxis=dict(title='Y', **axis),
+            zaxis=dict(title='Z', **axis),
+            aspectmode='data',
             camera=dict(up=dict(x=0, y=0, z=1))
         ),
         margin=dict(l=0, r=0, b=0, t=30),
         showlegend=True,
-        scene_aspectmode='data',
         font=dict(color=theme_colors['text_color'])
     )
+
+def table_style(theme):
+    """style_cell, style_header and style_data_conditional of the results table"""
     dark_templates = ['dark','night']
-    is_dark = theme in dark_templates 
-    # # ----------------------------------------------------------
-    # # Update layout with Plotly template
-    # fig.update_layout(
-    #     template=template,  # Use the selected Plotly template
-    #     scene=dict(
-    #         xaxis=dict(title='X'),
-    #         yaxis=dict(title='Y'),
-    #         zaxis=dict(title='Z'),
-    #         aspectmode='cube',
-    #         camera=dict(up=dict(x=0, y=0, z=1))
-    #     ),
-    #     margin=dict(l=0, r=0, b=0, t=30),
-    #     showlegend=True,
-    #     scene_aspectmode='data'
-    # )
-
-    # Create results table with styling based on template
-    # dark_templates = ['plotly_dark']
-    # is_dark = template in dark_templates
-    # # ----------------------------------------------------------
-    table = dash_table.DataTable(
-        columns=[{'name': col, 'id': col} for col in ['System', 'Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz']],
-        data=results,
-        style_cell={
+    is_dark = theme in dark_templates
+    return ({
             'textAlign': 'center',
             'padding': '5px',
             'backgroundColor': '#283442' if is_dark else 'white',
             'color': 'white' if is_dark else 'black'
-        },
-        style_header={
+        }, {
             'backgroundColor': '#3B4754' if is_dark else 'lightgrey',
             'fontWeight': 'bold',
             'color': 'white' if is_dark else 'black'
-        },
-        style_data_conditional=[{
+        }, [{
             'if': {'row_index': 'odd'},
             'backgroundColor': '#3B4754' if is_dark else 'rgb(248, 248, 248)'
-        }]
-    )
+        }])
+
+def normalize_colors(items):
+    for item in items:
+        if isinstance(item['color'], str):  # Handle legacy format
+            item['color'] = {'hex': item['color']}
+
+def connection_trace(load, target):
+    return plot3d.connection_line_trace(load['translation'], target['translation'], load['color']['hex'])
+
+def load_traces(i, load, targets):
+    """Trace dicts of one load system: triad, force and moment vectors, then one connection line per target"""
+    load_name = load.get('name', f'Load System {i+1}')
+    R, pos = system_rotation(load), np.array(load['translation'])
+    color = load['color']['hex']
+
+    # Add coordinate system
+    traces = plot3d.TraceAccumulator(plot3d.triad_traces(np.radians(load['euler_angles']),
+                                                         load['rotation_order'],
+                                                         load['translation'],
+                                                         tip_size = 0.5, len_triad = 1,colors_arr = color,
+                                                         triad_name = f"{load_name}:InputCSYS", legendgroup= f'group{i}'))
+    # Add vectors
+    if 'force' in load:
+        traces.extend(plot3d.vector_traces(pos, R @ load['force'], color, f"Force:{load['force']}",
+                                           legendgroup= f'force_group{i}',triad_name = f"{load_name}:Force"))
+    if 'moment' in load:
+        traces.extend(plot3d.vector_traces(pos, R @ load['moment'], color, f"Moment:{load['moment']}",
+                                           legendgroup= f'force_group{i}',triad_name = f"{load_name}:Moment"))
+    # Add connection lines to all targets
+    traces.extend(connection_trace(load, target) for target in targets)
+    return traces.traces
 
-    return fig, table
+def target_traces(i, target):
+    """Trace dicts of one target system triad"""
+    target_name = target.get('name', f'Target {i+1}')
+    return plot3d.triad_traces(np.radians(target['euler_angles']),
+                               target['rotation_order'],
+                               target['translation'],
+                               tip_size = 0.5, len_triad = 1,colors_arr = target['color']['hex'],
+                               triad_name = f"{target_name}:OutCSYS", legendgroup= f'Out_group{i}')
+
+def add_load_to_batch(batch, i, load, targets):
+    """Adds one load system (triad, vectors, connection lines) to a plot3d.BatchedTraces"""
+    load_name = load.get('name', f'Load System {i+1}')
+    R, pos = system_rotation(load), np.array(load['translation'])
+    color = load['color']['hex']
+    batch.add_triad(np.radians(load['euler_angles']), load['rotation_order'], load['translation'],
+                    colors_arr = color, triad_name = f"{load_name}:InputCSYS")
+    if 'force' in load:
+        batch.add_vector(pos, R @ load['force'], color, f"Force:{load['force']}", triad_name = f"{load_name}:Force")
+    if 'moment' in load:
+        batch.add_vector(pos, R @ load['moment'], color, f"Moment:{load['moment']}", triad_name = f"{load_name}:Moment")
+    for j, target in enumerate(targets):
+        batch.add_connection(load['translation'], target['translation'], color,
+                             f"{load_name} → {target.get('name', f'Target {j+1}')}")
+
+def add_target_to_batch(batch, i, target):
+    """Adds one target system triad to a plot3d.BatchedTraces"""
+    target_name = target.get('name', f'Target {i+1}')
+    batch.add_triad(np.radians(target['euler_angles']), target['rotation_order'], target['translation'],
+                    colors_arr = target['color']['hex'], triad_name = f"{target_name}:OutCSYS")
+
+def render_style(render_mode, loads, targets, lod_threshold=LOD_THRESHOLD):
+    """'systems', 'batched' or 'lod' for the selected render mode and scene size"""
+    if render_mode == 'auto':
+        n_systems = len(loads) + len(targets)
+        if n_systems > (lod_threshold or LOD_THRESHOLD):
+            return 'lod'
+        return 'batched' if n_systems > BATCH_THRESHOLD else 'systems'
+    return render_mode
+
+def compute_results(loads, targets):
+    """results-store data: target names and (M,6) resultants, all targets in one vectorized transfer"""
+    try:
+        if loads:
+            resultants = rlt.transfer_systems(loads, targets, degrees=True)
+        else:
+            resultants = np.zeros((len(targets), 6))
+    except Exception as e:
+        print(f"Error computing resultants: {e}")
+        return {'systems': [], 'resultants': []}
+    return {'systems': [target.get('name', f'Target {i+1}') for i, target in enumerate(targets)],
+            'resultants': resultants.tolist()}
+
+def result_rows(results):
+    """Results table rows of the results-store data"""
+    return [{
+        'System': name,
+        'Fx': f"{R[0]:.2f}", 'Fy': f"{R[1]:.2f}", 'Fz': f"{R[2]:.2f}",
+        'Mx': f"{R[3]:.2f}", 'My': f"{R[4]:.2f}", 'Mz': f"{R[5]:.2f}"
+    } for name, R in zip(results['systems'], results['resultants'])]
+
+def build_figure(loads, targets, theme):
+    """
+    Full figure dict and the trace index map used to patch it per system: [start, count] of every
+    system, and the index of each load's first connection line (None if the load drew nothing).
+    Traces are collected as plain dicts and sent unvalidated, so the build is linear in the trace count.
+    """
+    traces = plot3d.TraceAccumulator([dict(type='scatter3d', x=[0], y=[0], z=[0], mode='markers',
+                                           marker=dict(size=4, color='black'), name='Global')])
+    load_slices, load_connections, target_slices = [], [], []
+    for i, load in enumerate(loads):
+        try:
+            system = load_traces(i, load, targets)
+            # load_traces ends with one connection line per target
+            connections = len(traces) + len(system) - len(targets)
+        except Exception as e:
+            print(f"Error processing load {i}: {e}")
+            system, connections = [], None
+        load_slices.append([len(traces), len(system)])
+        load_connections.append(connections)
+        traces.extend(system)
+    for i, target in enumerate(targets):
+        try:
+            system = target_traces(i, target)
+        except Exception as e:
+            print(f"Error processing target {i}: {e}")
+            system = []
+        target_slices.append([len(traces), len(system)])
+        traces.extend(system)
+
+    fig = traces.figure(theme_layout(theme), validate=False)
+    return fig, {'load_slices': load_slices, 'load_connections': load_connections, 'target_slices': target_slices}
+
+def build_batched_figure(loads, targets, theme):
+    """Figure dict with a constant number of traces, see plot3d.BatchedTraces"""
+    batch = plot3d.BatchedTraces()
+    for i, load in enumerate(loads):
+        try:
+            add_load_to_batch(batch, i, load, targets)
+        except Exception as e:
+            print(f"Error processing load {i}: {e}")
+    for i, target in enumerate(targets):
+        try:
+            add_target_to_batch(batch, i, target)
+        except Exception as e:
+            print(f"Error processing target {i}: {e}")
+    traces = plot3d.TraceAccumulator([dict(type='scatter3d', x=[0], y=[0], z=[0], mode='markers',
+                                           marker=dict(size=4, color='black'), name='Global')])
+    traces.extend(batch.traces(tip_size=0.2))
+    return traces.figure(theme_layout(theme), validate=False)
+
+def origin_trace(items, kind, symbol):
+    """One marker per system origin, clickable for drill-down (customdata = [kind, index])"""
+    positions = np.array([item['translation'] for item in items], dtype=float).reshape(-1, 3)
+    names = [item.get('name', f'{kind.capitalize()} {i+1}') for i, item in enumerate(items)]
+    return dict(type='scatter3d', mode='markers', name=f'{kind.capitalize()} origins',
+                x=positions[:, 0].tolist(), y=positions[:, 1].tolist(), z=positions[:, 2].tolist(),
+                marker=dict(size=3, symbol=symbol, color=[item['color']['hex'] for item in items]),
+                customdata=[[kind, i] for i in range(len(items))],
+                hoverinfo='text', hovertext=names)
+
+def build_lod_figure(loads, targets, theme, top_k=LOD_TOP_K, detail=()):
+    """
+    Level-of-detail figure for large scenes, with a size bounded by the number of systems
+    instead of loads x targets:
+        system origins as point markers,
+        force and moment vectors for the top_k largest magnitudes only,
+        one aggregated connection line per target, from the centroid of the load origins,
+        full triads, vectors and connection lines for the drill-down systems in detail.
+    """
+    batch = plot3d.BatchedTraces()
+    detail = {(kind, i) for kind, i in detail}
+    for i, load in enumerate(loads):
+        if ('load', i) in detail:
+            add_load_to_batch(batch, i, load, targets)
+    for i, target in enumerate(targets):
+        if ('target', i) in detail:
+            add_target_to_batch(batch, i, target)
+
+    # Vectors of the largest forces and moments. Zero vectors and loads already drawn in detail
+    # are dropped before ranking, so they do not take any of the top_k slots
+    top_k = max(0, int(top_k or 0))
+    for field in ('force', 'moment'):
+        vectors = np.array([load.get(field, [0, 0, 0]) for load in loads], dtype=float).reshape(-1, 3)
+        magnitude = np.linalg.norm(vectors, axis=1)
+        candidates = np.array([i for i in np.flatnonzero(magnitude > 0) if ('load', i) not in detail], dtype=int)
+        for i in candidates[np.argsort(magnitude[candidates])[::-1][:top_k]]:
+            load = loads[i]
+            load_name = load.get('name', f'Load System {i+1}')
+            batch.add_vector(load['translation'], system_rotation(load) @ vectors[i], load['color']['hex'],
+                             f"{field.capitalize()}:{load[field]}", triad_name = f"{load_name}:{field.capitalize()}")
+
+    if loads:
+        centroid = np.mean([load['translation'] for load in loads], axis=0)
+        for j, target in enumerate(targets):
+            batch.add_connection(centroid, target['translation'], 'gray',
+                                 f"{len(loads)} loads → {target.get('name', f'Target {j+1}')}")
+
+    traces = plot3d.TraceAccumulator([dict(type='scatter3d', x=[0], y=[0], z=[0], mode='markers',
+                                           marker=dict(size=4, color='black'), name='Global')])
+    if loads:
+        traces.add(origin_trace(loads, 'load', 'circle'))
+    if targets:
+        traces.add(origin_trace(targets, 'target', 'diamond'))
+    traces.extend(batch.traces(tip_size=0.2))
+    return traces.figure(theme_layout(theme), validate=False)
+
+def patch_figure(loads, targets, state):
+    """
+    Patch with the traces of changed systems only, or None if the figure must be rebuilt.
+    A moved target also refreshes the connection line of every load to it.
+    """
+    if len(loads) != len(state['loads']) or len(targets) != len(state['targets']):
+        return None
+    patch = Patch()
+
+    def set_traces(start, count, traces):
+        if len(traces) != count:
+            raise ValueError("trace count changed")
+        for k, trace in enumerate(traces):
+            patch['data'][start + k] = trace
+
+    changed_loads = {i for i, load in enumerate(loads) if system_hash(load) != state['loads'][i]}
+    moved_targets = [j for j, target in enumerate(targets) if target['translation'] != state['target_positions'][j]]
+    try:
+        for i in changed_loads:
+            set_traces(*state['load_slices'][i], load_traces(i, loads[i], targets))
+        for i, target in enumerate(targets):
+            if system_hash(target) != state['targets'][i]:
+                set_traces(*state['target_slices'][i], target_traces(i, target))
+        for i, load in enumerate(loads):
+            # A load that drew nothing has no connection lines to move
+            connections = state['load_connections'][i]
+            if i in changed_loads or connections is None:
+                continue
+            for j in moved_targets:
+                set_traces(connections + j, 1, [connection_trace(load, targets[j])])
+    except Exception as e:
+        print(f"Falling back to full figure: {e}")
+        return None
+    return patch
+
+def patch_rows(rows, row_hashes, old_hashes):
+    """Patch with the changed results table rows only, or None if the row count changed"""
+    if old_hashes is None or len(rows) != len(old_hashes):
+        return None
+    patch = Patch()
+    for j, (row, row_hash, old_hash) in enumerate(zip(rows, row_hashes, old_hashes)):
+        if row_hash != old_hash:
+            patch[j] = row
+    return patch
+
+# Computation callback: numbers only, the table and the figure render independently
+@app.callback(
+    Output('results-store', 'data'),
+    [Input('loads-store', 'data'),
+     Input('targets-store', 'data')]
+)
+def update_results(loads, targets):
+    return compute_results(loads, targets)
+
+# Results table callback
+@app.callback(
+    [Output('results-table', 'data'),
+     Output('results-rows', 'data')],
+    Input('results-store', 'data'),
+    State('results-rows', 'data')
+)
+def update_results_table(results, old_hashes):
+    if results is None:
+        return dash.no_update, dash.no_update
+    rows = result_rows(results)
+    row_hashes = [system_hash(row) for row in rows]
+    table = patch_rows(rows, row_hashes, old_hashes)
+    return (rows if table is None else table), row_hashes
+
+# Theme callbacks, run in the browser: the layout and table styles of every theme are
+# embedded once, so a theme switch sends nothing to the server and no trace data back
+THEME_STYLES = {theme: {'layout': theme_layout(theme), 'table': table_style(theme)} for theme in PLOT_THEMES}
+
+app.clientside_callback(
+    """
+    function(theme) {
+        const styles = %s[theme];
+        return styles ? styles.table : window.dash_clientside.no_update;
+    }
+    """ % json.dumps(THEME_STYLES),
+    [Output('results-table', 'style_cell'),
+     Output('results-table', 'style_header'),
+     Output('results-table', 'style_data_conditional')],
+    Input('theme-selector', 'value')
+)
+
+app.clientside_callback(
+    """
+    function(theme, figure) {
+        const styles = %s[theme];
+        if (!styles || !figure) {
+            return window.dash_clientside.no_update;
+        }
+        // Copy-on-write merge, the trace data is shared with the current figure
+        function merge(base, update) {
+            const out = Object.assign({}, base);
+            for (const key in update) {
+                const value = update[key];
+                const nested = value && typeof value === 'object' && !Array.isArray(value);
+                out[key] = nested && base && typeof base[key] === 'object' ? merge(base[key], value) : value;
+            }
+            return out;
+        }
+        return Object.assign({}, figure, {layout: merge(figure.layout || {}, styles.layout)});
+    }
+    """ % json.dumps({theme: {'layout': styles['layout']} for theme, styles in THEME_STYLES.items()}),
+    Output('3d-plot', 'figure', allow_duplicate=True),
+    Input('theme-selector', 'value'),
+    State('3d-plot', 'figure'),
+    prevent_initial_call=True
+)
+
+# Visualization callback
+@app.callback(
+    [Output('3d-plot', 'figure'),
+     Output('figure-state', 'data')],
+    [Input('loads-store', 'data'),
+     Input('targets-store', 'data'),
+     Input('render-mode', 'value'),
+     Input('lod-threshold', 'value'),
+     Input('lod-top-k', 'value'),
+     Input('detail-systems', 'data')],
+    [State('theme-selector', 'value'),
+     State('figure-state', 'data')]
+)
+def update_visualization(loads, 
+                         targets, 
+                         render_mode,
+                         lod_threshold,
+                         top_k,
+                         detail,
+                         theme,
+                         state):
+    # The theme is only read for full rebuilds, switching it is handled in the browser
+    triggered = {t['prop_id'] for t in dash.callback_context.triggered}
+    normalize_colors(loads)
+    normalize_colors(targets)
+
+    style = render_style(render_mode, loads, targets, lod_threshold)
+    fig = None
+    if style == 'lod':
+        fig = build_lod_figure(loads, targets, theme, top_k, detail)
+    elif style == 'batched':
+        # A few merged traces, nothing to patch per system
+        fig = build_batched_figure(loads, targets, theme)
+    elif state and state.get('style') == 'systems' and triggered <= {'loads-store.data', 'targets-store.data'}:
+        fig = patch_figure(loads, targets, state)
+    if style != 'systems':
+        slices = {'load_slices': [], 'load_connections': [], 'target_slices': []}
+    elif fig is None:
+        fig, slices = build_figure(loads, targets, theme)
+    else:
+        slices = {key: state[key] for key in ('load_slices', 'load_connections', 'target_slices')}
+
+    new_state = dict(slices,
+                     style=style,
+                     loads=[system_hash(load) for load in loads],
+                     targets=[system_hash(target) for target in targets],
+                     target_positions=[target['translation'] for target in targets])
+    return fig, new_state
+
+# Level-of-detail drill-down: clicking a system origin toggles it in full detail
+@app.callback(
+    Output('detail-systems', 'data'),
+    [Input('3d-plot', 'clickData'),
+     Input('clear-detail-btn', 'n_clicks')],
+    State('detail-systems', 'data'),
+    prevent_initial_call=True
+)
+def update_detail_systems(click_data, n_clicks, detail):
+    if dash.callback_context.triggered_id == 'clear-detail-btn':
+        return []
+    point = (click_data or {}).get('points', [{}])[0]
+    system = point.get('customdata')
+    if not (isinstance(system, list) and len(system) == 2 and system[0] in ('load', 'target')):
+        return dash.no_update
+    if system in detail:
+        return [item for item in detail if item != system]
+    return detail + [system]
 
 @app.callback(
     Output('download-data', 'data'),
     Input('export-btn', 'n_clicks'),
     [State('loads-store', 'data'),
      State('targets-store', 'data'),
-     State('results-container', 'children')],
+     State('results-table', 'data')],
     prevent_initial_call=True
 )
 def export_data(n_clicks, loads, targets, results):
@@ -688,8 +1018,8 @@ def export_data(n_clicks, loads, targets, results):
     
     # Add results
     content += "\n=== Calculation Results ===\n"
-    if results and 'props' in results and 'data' in results['props']:
-        for row in results['props']['data']:
+    if results:
+        for row in results:
             content += f"{row['System']}:\n"
             content += f"  Force: X={row['Fx']}, Y={row['Fy']}, Z={row['Fz']}\n"
             content += f"  Moment: X={row['Mx']}, Y={row['My']}, Z={row['Mz']}\n\n"
@@ -731,7 +1061,14 @@ def update_stores_from_file(contents, filename):
                 if 'euler_angles' in target:
                     target['euler_angles'] = np.array(target['euler_angles']).tolist()
             
+            bump_panel_revision()
             return data.get('loads', []), data.get('targets', [])
+
+        elif filename.endswith('.npz'):
+            # Columnar load case from load_case_io
+            loads, targets = load_case_io.load_case_from_bytes(decoded)
+            bump_panel_revision()
+            return loads, targets
             
         else:
             raise ValueError("Unsupported file format")
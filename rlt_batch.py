@@ -0,0 +1,182 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Headless batch runner for load-case files (load_input.json format)
+
+Example:
+    python rlt_batch.py "cases/*.json" -o results.csv --workers 8
+
+Every load-case file holds 'loads' and 'targets' as in load_input.json (angles in degrees),
+either as JSON or as a columnar NPZ file from load_case_io. Files are spread across a process pool, each one is evaluated with
+rigid_load_transfer.transfer_systems, and all resultants are written to one table with a
+row per (case, target): CSV, Parquet (needs pyarrow) or NPZ, chosen by the output extension.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import load_case_io
+import rigid_load_transfer as rlt
+
+LOAD_CASE_EXTENSIONS = ('*.json', '*.npz')
+
+RESULT_COLUMNS = ('Fx', 'Fy', 'Fz', 'Mx', 'My', 'Mz')
+OUTPUT_FORMATS = ('csv', 'parquet', 'npz')
+
+
+def find_load_cases(patterns):
+    """Sorted load-case files from directories (all *.json and *.npz inside), glob patterns or file names
+
+    Args:
+        patterns (list): [directories, glob patterns or file paths]
+
+    Returns:
+        [list]: file paths, without duplicates
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for extension in LOAD_CASE_EXTENSIONS:
+                paths += glob.glob(os.path.join(pattern, extension))
+        else:
+            paths += glob.glob(pattern) or [pattern]
+    return sorted(set(paths))
+
+
+def evaluate_load_case(path):
+    """Resultants of one load-case file in every target system
+
+    Args:
+        path (str): [load-case JSON or NPZ file]
+
+    Returns:
+        [tuple]: (path, target names, (M,6) resultants [Fx, Fy, Fz, Mx, My, Mz])
+    """
+    if path.endswith('.npz'):
+        # Columnar file: the arrays go straight into the transfer, no dictionaries
+        case = load_case_io.open_load_case(path)
+        if not case.n_loads:
+            return path, case.target_names(), np.zeros((case.n_targets, 6))
+        return path, case.target_names(), case.resultants()
+    loads, targets = load_case_io.read_load_case(path)
+    names = [target.get('name', f'Target {i+1}') for i, target in enumerate(targets)]
+    if not loads:
+        return path, names, np.zeros((len(targets), 6))
+    return path, names, rlt.transfer_systems(loads, targets, degrees=True)
+
+
+def _evaluate_or_error(path):
+    # Worker entry point: a broken file is reported instead of stopping the whole run
+    try:
+        return evaluate_load_case(path)
+    except Exception as e:
+        return path, None, f"{type(e).__name__}: {e}"
+
+
+def run_load_cases(paths, workers=None, chunksize=None):
+    """Evaluates load-case files in a process pool and collects one result table
+
+    Args:
+        paths (list): [load-case JSON or NPZ files]
+        workers (int): [number of processes, 1 runs in this process]. Defaults to os.cpu_count().
+        chunksize (int): [files sent to a worker at a time]. Defaults to an even split in 4 chunks per worker.
+
+    Returns:
+        [dict]: 'case' and 'target' (K,) string arrays, 'resultants' (K,6) array, one row per
+                (case, target), and 'errors' {path: message} for files that could not be evaluated
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        results = list(map(_evaluate_or_error, paths))
+    else:
+        chunksize = chunksize or max(1, len(paths) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_evaluate_or_error, paths, chunksize=chunksize))
+
+    cases, targets, resultants, errors = [], [], [], {}
+    for path, names, value in results:
+        if names is None:
+            errors[path] = value
+            continue
+        cases += [path] * len(names)
+        targets += names
+        resultants.append(value)
+
+    return {
+        'case': np.array(cases, dtype=str),
+        'target': np.array(targets, dtype=str),
+        'resultants': np.concatenate(resultants) if resultants else np.empty((0, 6)),
+        'errors': errors
+    }
+
+
+def result_frame(table):
+    """pandas DataFrame of a run_load_cases table"""
+    import pandas as pd
+    frame = pd.DataFrame(table['resultants'], columns=list(RESULT_COLUMNS))
+    frame.insert(0, 'target', table['target'])
+    frame.insert(0, 'case', table['case'])
+    return frame
+
+
+def write_results(table, output_path, fmt=None):
+    """Writes a run_load_cases table as CSV, Parquet or NPZ
+
+    Args:
+        table (dict): [result of run_load_cases]
+        output_path (str): [output file]
+        fmt (str): ['csv', 'parquet' or 'npz']. Defaults to the output file extension.
+    """
+    fmt = fmt or os.path.splitext(output_path)[1].lstrip('.').lower()
+    if fmt == 'npz':
+        np.savez(output_path, case=table['case'], target=table['target'], resultants=table['resultants'],
+                 columns=np.array(RESULT_COLUMNS))
+    elif fmt == 'csv':
+        result_frame(table).to_csv(output_path, index=False)
+    elif fmt == 'parquet':
+        result_frame(table).to_parquet(output_path, index=False)
+    else:
+        raise ValueError(f"Unsupported output format: {fmt!r}, expected one of {OUTPUT_FORMATS}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Compute target resultants of many load-case JSON files')
+    parser.add_argument('inputs', nargs='+', help='load-case files, glob patterns or directories')
+    parser.add_argument('-o', '--output', required=True, help='result table (.csv, .parquet or .npz)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, help='output format (default: from the extension)')
+    parser.add_argument('--workers', type=int, default=None, help='number of processes (default: all cores)')
+    parser.add_argument('--chunksize', type=int, default=None, help='files per task sent to a worker')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    paths = find_load_cases(args.inputs)
+    if not paths:
+        print("No load-case files found", file=sys.stderr)
+        return 1
+
+    start = time.perf_counter()
+    table = run_load_cases(paths, workers=args.workers, chunksize=args.chunksize)
+    write_results(table, args.output, args.format)
+    elapsed = time.perf_counter() - start
+
+    for path, message in table['errors'].items():
+        print(f"Skipped {path}: {message}", file=sys.stderr)
+    n_cases = len(paths) - len(table['errors'])
+    rate = n_cases / elapsed if elapsed > 0 else float('inf')
+    print(f"Evaluated {n_cases} load cases ({len(table['case'])} rows) in {elapsed:.3f} s "
+          f"({rate:,.0f} cases/sec)", file=sys.stderr)
+    return 1 if table['errors'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,287 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+
+Shared rotation core: batches of unit quaternions with conversion to/from DCM and Euler angles.
+
+Euler sequences follow the usual convention: upper case is intrinsic, lower case is extrinsic.
+    'XYZ' (intrinsic): R = Rx(a0) @ Ry(a1) @ Rz(a2)
+    'xyz' (extrinsic): R = Rz(a2) @ Ry(a1) @ Rx(a0)   (rigid_load_transfer's rotation_order)
+"""
+import math
+
+import numpy as np
+
+# Tait-Bryan sequences first, then proper Euler sequences (intrinsic form)
+EULER_SEQUENCES = ("XYZ", "ZXY", "YZX", "ZYX", "YXZ", "XZY",
+                   "XYX", "XZX", "YXY", "YZY", "ZXZ", "ZYZ")
+
+# cos(theta2) (Tait-Bryan) or sin(theta2) (proper Euler) below this is treated as gimbal lock
+GIMBAL_LOCK_TOL = 1e-9
+
+
+def _sequence_entry(sequence):
+    """(a, b, c, s, proper): axis indices, parity of (a, b, c) and proper-Euler flag"""
+    a, b, last = ("XYZ".index(axis) for axis in sequence)
+    proper = last == a
+    c = 3 - a - b
+    s = 1 if (b - a) % 3 == 1 else -1
+    return a, b, c, s, proper
+
+
+# Precomputed once, so a conversion is a single dict lookup whatever the sequence
+SEQUENCE_TABLE = {sequence: _sequence_entry(sequence) for sequence in EULER_SEQUENCES}
+
+
+def _dcm_index(a, b, c):
+    """Flat positions in the sequence's DCM of the entries of the canonical XYZ/XYX matrix"""
+    perm = (a, b, c)
+    return np.array([3*perm[i] + perm[j] for i in range(3) for j in range(3)])
+
+
+# R_a(t1) R_b(t2) R_c(t3) is the canonical XYZ (or XYX) matrix of angles s*t, with rows and
+# columns permuted to (a, b, c), so one scatter index per sequence covers all 12 of them
+DCM_INDEX = {sequence: _dcm_index(*entry[:3]) for sequence, entry in SEQUENCE_TABLE.items()}
+
+
+def _intrinsic(sequence):
+    """Returns (intrinsic sequence, reverse_angles) for an intrinsic or extrinsic sequence"""
+    if sequence.isupper():
+        intrinsic, reverse = sequence, False
+    elif sequence.islower():
+        # Extrinsic abc with (a0, a1, a2) is intrinsic CBA with (a2, a1, a0)
+        intrinsic, reverse = sequence[::-1].upper(), True
+    else:
+        intrinsic = None
+    if intrinsic not in SEQUENCE_TABLE:
+        raise ValueError(f"Invalid Euler sequence: {sequence}")
+    return intrinsic, reverse
+
+
+def euler_to_dcm(angles, sequence="xyz"):
+    """
+    Closed-form rotation matrices from Euler angles
+
+    All nine entries are written directly from the sines and cosines, no axis matmuls.
+
+    Parameters:
+        angles: [a0, a1, a2] or (N,3) angles in radians
+        sequence: one of EULER_SEQUENCES, upper case intrinsic or lower case extrinsic
+
+    Returns:
+        (3,3) matrix for a single set of angles, (N,3,3) stack for (N,3) angles
+    """
+    intrinsic, reverse = _intrinsic(sequence)
+    a, b, c, s, proper = SEQUENCE_TABLE[intrinsic]
+
+    angles = np.asarray(angles, dtype=float)
+    if angles.ndim == 1:
+        return _single_dcm(angles.tolist(), intrinsic, reverse)
+    angles = angles.reshape(-1, 3)
+    if reverse:
+        angles = angles[:, ::-1]
+    c1, c2, c3 = np.cos(angles).T
+    s1, s2, s3 = (s*np.sin(angles)).T
+
+    if proper:
+        entries = (c2, s2*s3, s2*c3,
+                   s1*s2, c1*c3 - s1*c2*s3, -c1*s3 - s1*c2*c3,
+                   -c1*s2, s1*c3 + c1*c2*s3, c1*c2*c3 - s1*s3)
+    else:
+        entries = (c2*c3, -c2*s3, s2,
+                   c1*s3 + s1*s2*c3, c1*c3 - s1*s2*s3, -s1*c2,
+                   s1*s3 - c1*s2*c3, s1*c3 + c1*s2*s3, c1*c2)
+
+    R = np.empty((len(angles), 9))
+    R[:, DCM_INDEX[intrinsic]] = np.column_stack(entries)
+    return R.reshape(-1, 3, 3)
+
+
+def _single_dcm(angles, intrinsic, reverse):
+    """euler_to_dcm for one set of angles, on plain floats with the math module"""
+    a, b, c, s, proper = SEQUENCE_TABLE[intrinsic]
+    t1, t2, t3 = angles[::-1] if reverse else angles
+    c1, c2, c3 = math.cos(t1), math.cos(t2), math.cos(t3)
+    s1, s2, s3 = s*math.sin(t1), s*math.sin(t2), s*math.sin(t3)
+
+    if proper:
+        entries = (c2, s2*s3, s2*c3,
+                   s1*s2, c1*c3 - s1*c2*s3, -c1*s3 - s1*c2*c3,
+                   -c1*s2, s1*c3 + c1*c2*s3, c1*c2*c3 - s1*s3)
+    else:
+        entries = (c2*c3, -c2*s3, s2,
+                   c1*s3 + s1*s2*c3, c1*c3 - s1*s2*s3, -s1*c2,
+                   s1*s3 - c1*s2*c3, s1*c3 + c1*s2*s3, c1*c2)
+
+    R = np.empty(9)
+    R[DCM_INDEX[intrinsic]] = entries
+    return R.reshape(3, 3)
+
+
+def dcm_to_euler(R, sequence="XYZ"):
+    """
+    Euler angles of a stack of rotation matrices
+
+    Parameters:
+        R: (N,3,3) rotation matrices (a single 3x3 matrix is also accepted)
+        sequence: one of EULER_SEQUENCES, upper case intrinsic or lower case extrinsic
+
+    Returns:
+        (N,3) angles in radians. In gimbal lock the third intrinsic angle is set to 0.
+    """
+    intrinsic, reverse = _intrinsic(sequence)
+    a, b, c, s, proper = SEQUENCE_TABLE[intrinsic]
+
+    R = np.asarray(R, dtype=float).reshape(-1, 3, 3)
+    angles = np.empty((len(R), 3))
+    if proper:
+        locked = np.hypot(R[:, b, a], R[:, c, a]) < GIMBAL_LOCK_TOL
+        angles[:, 0] = np.arctan2(R[:, b, a], -s*R[:, c, a])
+        angles[:, 1] = np.arccos(np.clip(R[:, a, a], -1.0, 1.0))
+        angles[:, 2] = np.arctan2(R[:, a, b], s*R[:, a, c])
+    else:
+        locked = np.hypot(R[:, b, c], R[:, c, c]) < GIMBAL_LOCK_TOL
+        angles[:, 0] = np.arctan2(-s*R[:, b, c], R[:, c, c])
+        angles[:, 1] = np.arcsin(np.clip(s*R[:, a, c], -1.0, 1.0))
+        angles[:, 2] = np.arctan2(-s*R[:, a, b], R[:, a, a])
+
+    angles[:, 0] = np.where(locked, np.arctan2(s*R[:, c, b], R[:, b, b]), angles[:, 0])
+    angles[:, 2] = np.where(locked, 0.0, angles[:, 2])
+    return angles[:, ::-1].copy() if reverse else angles
+
+
+class QuaternionArray:
+    """
+    Batch of N unit quaternions stored as an (N,4) array of [w, x, y, z]
+
+    Composition follows matrix products: (p * q).to_dcm() == p.to_dcm() @ q.to_dcm()
+    A batch of length 1 broadcasts against any other length.
+    """
+    __slots__ = ('q',)
+
+    def __init__(self, q):
+        self.q = np.asarray(q, dtype=float).reshape(-1, 4)
+
+    def __len__(self):
+        return len(self.q)
+
+    def __getitem__(self, index):
+        return QuaternionArray(self.q[index])
+
+    def __repr__(self):
+        return f"QuaternionArray({self.q!r})"
+
+    @classmethod
+    def identity(cls, n=1):
+        q = np.zeros((n, 4))
+        q[:, 0] = 1.0
+        return cls(q)
+
+    @classmethod
+    def from_axis_angle(cls, axis, angles):
+        """
+        Rotations by angles (radians) about axis, one of 'x', 'y', 'z' or (N,3) unit vectors
+        """
+        half = 0.5*np.asarray(angles, dtype=float).reshape(-1)
+        q = np.zeros((len(half), 4))
+        q[:, 0] = np.cos(half)
+        if isinstance(axis, str):
+            q[:, 1 + "xyz".index(axis.lower())] = np.sin(half)
+        else:
+            q[:, 1:] = np.sin(half)[:, np.newaxis]*np.asarray(axis, dtype=float).reshape(-1, 3)
+        return cls(q)
+
+    @classmethod
+    def from_euler(cls, angles, sequence="xyz"):
+        """
+        Rotations from (N,3) Euler angles in radians
+
+        Parameters:
+            angles: (N,3) angles (a single [a0, a1, a2] is also accepted)
+            sequence: one of EULER_SEQUENCES, upper case intrinsic or lower case extrinsic
+        """
+        intrinsic, reverse = _intrinsic(sequence)
+        angles = np.asarray(angles, dtype=float).reshape(-1, 3)
+        if reverse:
+            angles = angles[:, ::-1]
+        return (cls.from_axis_angle(intrinsic[0], angles[:, 0])
+                * cls.from_axis_angle(intrinsic[1], angles[:, 1])
+                * cls.from_axis_angle(intrinsic[2], angles[:, 2]))
+
+    @classmethod
+    def from_dcm(cls, R):
+        """
+        Rotations from (N,3,3) rotation matrices (Shepperd's method, stable for all angles)
+        """
+        R = np.asarray(R, dtype=float).reshape(-1, 3, 3)
+        diagonal = np.diagonal(R, axis1=1, axis2=2)
+        trace = diagonal.sum(axis=1)
+        choice = np.argmax(np.column_stack([diagonal, trace]), axis=1)
+
+        q = np.empty((len(R), 4))
+        for i in range(3):
+            mask = choice == i
+            j, k = (i + 1) % 3, (i + 2) % 3
+            Rm = R[mask]
+            q[mask, 1 + i] = 1 - trace[mask] + 2*Rm[:, i, i]
+            q[mask, 1 + j] = Rm[:, j, i] + Rm[:, i, j]
+            q[mask, 1 + k] = Rm[:, k, i] + Rm[:, i, k]
+            q[mask, 0] = Rm[:, k, j] - Rm[:, j, k]
+        mask = choice == 3
+        Rm = R[mask]
+        q[mask, 0] = 1 + trace[mask]
+        q[mask, 1] = Rm[:, 2, 1] - Rm[:, 1, 2]
+        q[mask, 2] = Rm[:, 0, 2] - Rm[:, 2, 0]
+        q[mask, 3] = Rm[:, 1, 0] - Rm[:, 0, 1]
+        return cls(q/np.linalg.norm(q, axis=1, keepdims=True))
+
+    def __mul__(self, other):
+        w1, x1, y1, z1 = self.q.T
+        w2, x2, y2, z2 = other.q.T
+        return QuaternionArray(np.column_stack([
+            w1*w2 - x1*x2 - y1*y2 - z1*z2,
+            w1*x2 + x1*w2 + y1*z2 - z1*y2,
+            w1*y2 - x1*z2 + y1*w2 + z1*x2,
+            w1*z2 + x1*y2 - y1*x2 + z1*w2
+        ]))
+
+    def inv(self):
+        """Inverse rotations (conjugates of unit quaternions)"""
+        return QuaternionArray(self.q*np.array([1.0, -1.0, -1.0, -1.0]))
+
+    def normalized(self):
+        return QuaternionArray(self.q/np.linalg.norm(self.q, axis=1, keepdims=True))
+
+    def apply(self, vectors):
+        """
+        Rotates (N,3) vectors (one rotation per vector, or one rotation for all vectors)
+        """
+        vectors = np.asarray(vectors, dtype=float)
+        w = self.q[:, :1]
+        u = self.q[:, 1:]
+        if vectors.ndim == 1:
+            w, u = w[0], u[0]
+        uv = np.cross(u, vectors)
+        return vectors + 2*(w*uv + np.cross(u, uv))
+
+    def to_dcm(self):
+        """(N,3,3) rotation matrices"""
+        w, x, y, z = self.q.T
+        R = np.empty((len(self.q), 3, 3))
+        R[:, 0, 0] = 1 - 2*(y*y + z*z)
+        R[:, 0, 1] = 2*(x*y - z*w)
+        R[:, 0, 2] = 2*(x*z + y*w)
+        R[:, 1, 0] = 2*(x*y + z*w)
+        R[:, 1, 1] = 1 - 2*(x*x + z*z)
+        R[:, 1, 2] = 2*(y*z - x*w)
+        R[:, 2, 0] = 2*(x*z - y*w)
+        R[:, 2, 1] = 2*(y*z + x*w)
+        R[:, 2, 2] = 1 - 2*(x*x + y*y)
+        return R
+
+    def to_euler(self, sequence="xyz"):
+        """(N,3) Euler angles in radians for any of EULER_SEQUENCES (upper case intrinsic, lower case extrinsic)"""
+        return dcm_to_euler(self.to_dcm(), sequence)
@@ -0,0 +1,58 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Checks of the composed-matrix transforms against coordinateTransform
+"""
+import itertools
+
+import numpy as np
+import pytest
+
+import coordinate_mapper as cm
+import rigid_load_transfer as rlt
+
+TRANSFORM_ORDERS = [''.join(order) for order in itertools.permutations('TXYZ')]
+
+
+@pytest.mark.parametrize('order', TRANSFORM_ORDERS)
+@pytest.mark.parametrize('typ', [1, 2])
+def test_transform_points_matches_coordinate_transform(order, typ, rng):
+    points = rng.normal(size=(20, 3))
+    settings = dict(order=order, Tra=[1, 2, 3], a_x=180, a_y=45, a_z=90, typ=typ)
+    expected = [cm.coordinateTransform(point=point, **settings) for point in points]
+    out = cm.transform_points(points, **settings)
+    np.testing.assert_allclose(out, expected, atol=1e-12)
+    np.testing.assert_allclose(cm.compile_transform(**settings).apply_inverse(out), points, atol=1e-12)
+
+
+def axis_matrices(Tra, a_x, a_y, a_z, typ):
+    """4x4 T, Rx, Ry, Rz matrices as the original coordinateTransform built them"""
+    sign = 1 if typ == 2 else -1
+    tx, ty, tz = (sign*value for value in Tra)
+    Tr = np.eye(4)
+    Tr[:3, 3] = [tx, ty, tz]
+    rotations = []
+    for axis, angle in zip('xyz', (a_x, a_y, a_z)):
+        R = np.eye(4)
+        R[:3, :3] = rlt._axis_rotation(axis, sign*np.deg2rad(angle))
+        rotations.append(R)
+    return (Tr, *rotations)
+
+
+@pytest.mark.parametrize('order', TRANSFORM_ORDERS + ['TXY', 'XYZ', 'ZT', 'TXYZT', ''])
+@pytest.mark.parametrize('typ', [1, 2])
+def test_transform_matrix_matches_order_mult(order, typ):
+    settings = ([1.0, -2.0, 3.0], 30.0, -40.0, 75.0)
+    expected = cm.orderMult(order, *axis_matrices(*settings, typ), typ)
+    np.testing.assert_allclose(cm.transformMatrix(order, *settings, typ), expected, atol=1e-12)
+
+
+def test_transform_sequence():
+    assert cm.transformSequence('TXY') == 'TXYZ'
+    assert cm.transformSequence('ZT') == 'ZTXY'
+    assert cm.transformSequence('TXYZT') == 'TXYZ'
+    with pytest.raises(ValueError):
+        cm.transformSequence('txyz')
@@ -0,0 +1,63 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Checks of the streaming point-file transformer
+"""
+import warnings
+
+import numpy as np
+
+import coordinate_mapper as cm
+import coordinate_transform_cli as cli
+
+SETTINGS = dict(order='TXYZ', Tra=[1, 2, 3], a_x=180, a_y=45, a_z=90, typ=1)
+
+
+def test_text_file_passes_other_columns_through(tmp_path, rng):
+    points = rng.normal(size=(7, 3))
+    lines = ['node,x,y,z,temperature\n', '# exported nodes\n']
+    lines += [f'{100 + i},{x:.17g},{y:.17g},{z:.17g},{20 + i}\n' for i, (x, y, z) in enumerate(points[:3])]
+    lines += ['# second block\n', '\n', '# more\n']
+    lines += [f'{100 + i},{x:.17g},{y:.17g},{z:.17g},{20 + i}  # tagged\n' for i, (x, y, z) in enumerate(points[3:], 3)]
+    source = tmp_path / 'nodes.csv'
+    source.write_text(''.join(lines))
+
+    output = tmp_path / 'nodes_out.csv'
+    with warnings.catch_warnings():
+        # A chunk of only comment lines must not reach np.loadtxt
+        warnings.simplefilter('error')
+        n_points = cli.transform_text_file(str(source), str(output), usecols=(1, 2, 3), skip_header=1,
+                                           chunk_size=3, fmt='%.12f', **SETTINGS)
+    assert n_points == len(points)
+
+    out_lines = output.read_text().splitlines()
+    assert len(out_lines) == len(lines)
+    assert out_lines[:2] == ['node,x,y,z,temperature', '# exported nodes']
+    assert out_lines[5:8] == ['# second block', '', '# more']
+    rows = [line.split('#')[0].split(',') for line in out_lines if line and not line.startswith(('#', 'node'))]
+    assert [row[0] for row in rows] == [str(100 + i) for i in range(len(points))]
+    assert [row[4].strip() for row in rows] == [str(20 + i) for i in range(len(points))]
+    assert out_lines[-1].endswith('# tagged')
+    np.testing.assert_allclose(np.array([row[1:4] for row in rows], dtype=float),
+                               cm.transform_points(points, **SETTINGS), atol=1e-10)
+
+
+def test_whitespace_file_matches_transform_points(tmp_path, rng):
+    points = rng.normal(size=(50, 3))
+    source = tmp_path / 'nodes.txt'
+    np.savetxt(source, points, fmt='%.17g')
+    output = tmp_path / 'nodes_out.txt'
+    cli.transform_text_file(str(source), str(output), chunk_size=16, fmt='%.12f', **SETTINGS)
+    np.testing.assert_allclose(np.loadtxt(output), cm.transform_points(points, **SETTINGS), atol=1e-10)
+
+
+def test_point_chunks_skip_comment_only_chunks():
+    lines = ['# a\n', '# b\n', '1 2 3\n', '4 5 6\n']
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        chunks = list(cli.iter_point_chunks(iter(lines), chunk_size=2))
+    assert len(chunks) == 1
+    np.testing.assert_array_equal(chunks[0], [[1, 2, 3], [4, 5, 6]])
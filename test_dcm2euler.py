@@ -0,0 +1,28 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Checks of the single and batched DCM-to-Euler conversions
+"""
+import numpy as np
+import pytest
+
+import dcm2euler
+from rotation import EULER_SEQUENCES, euler_to_dcm
+
+
+@pytest.mark.parametrize('sequence', EULER_SEQUENCES)
+def test_dcm2rotation_batch_matches_single(sequence, rng):
+    angles = rng.uniform(-np.pi, np.pi, (20, 3))
+    # dcm2rotation works on the transposed matrix: R.T = R_1(theta1) @ R_2(theta2) @ R_3(theta3)
+    R = np.transpose(euler_to_dcm(angles, sequence), (0, 2, 1))
+    batch = dcm2euler.dcm2rotation_batch(R, sequence)
+    np.testing.assert_allclose(batch, [dcm2euler.dcm2rotation(matrix, sequence) for matrix in R], atol=1e-12)
+    np.testing.assert_allclose(np.transpose(euler_to_dcm(batch, sequence), (0, 2, 1)), R, atol=1e-10)
+
+
+def test_dcm2rotation_invalid_sequence():
+    with pytest.raises(TypeError):
+        dcm2euler.dcm2rotation(np.eye(3), 'xyz')
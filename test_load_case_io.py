@@ -0,0 +1,50 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  JSON <-> NPZ round trips of load_case_io
+"""
+import copy
+import json
+import os
+
+import numpy as np
+
+import load_case_io
+import rigid_load_transfer as rlt
+
+LOAD_INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'load_input.json')
+
+
+def load_case():
+    """load_input.json, plus a load without a moment and one without a force"""
+    loads, targets = load_case_io.read_load_case(LOAD_INPUT)
+    no_moment = {key: value for key, value in copy.deepcopy(loads[0]).items() if key != 'moment'}
+    no_force = {key: value for key, value in copy.deepcopy(loads[1]).items() if key != 'force'}
+    no_moment['name'], no_force['name'] = 'no moment', 'no force'
+    return loads + [no_moment, no_force], targets
+
+
+def test_json_npz_round_trip(tmp_path):
+    loads, targets = load_case()
+    load_case_io.write_load_case(tmp_path / 'case.json', loads, targets)
+    load_case_io.write_load_case(tmp_path / 'case.npz', *load_case_io.read_load_case(tmp_path / 'case.json'))
+    assert load_case_io.read_load_case(tmp_path / 'case.npz') == (loads, targets)
+    with open(tmp_path / 'case.npz', 'rb') as f:
+        assert load_case_io.load_case_from_bytes(f.read()) == (loads, targets)
+
+    load_case_io.write_load_case(tmp_path / 'back.json', *load_case_io.read_load_case(tmp_path / 'case.npz'))
+    with open(tmp_path / 'back.json') as f:
+        assert json.load(f) == {'loads': loads, 'targets': targets}
+
+
+def test_resultants_match_transfer_systems(tmp_path):
+    loads, targets = load_case()
+    load_case_io.save_load_case(tmp_path / 'case.npz', loads, targets)
+    expected = rlt.transfer_systems(loads, targets, degrees=True)
+    for mmap in (True, False):
+        case = load_case_io.open_load_case(tmp_path / 'case.npz', mmap=mmap)
+        assert (case.n_loads, case.n_targets) == (len(loads), len(targets))
+        np.testing.assert_allclose(case.resultants(), expected, atol=1e-12)
@@ -0,0 +1,91 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Checks of load-case superposition and envelopes against per-case transfer_systems
+"""
+import numpy as np
+import pytest
+
+import load_combinations as lc
+import rigid_load_transfer as rlt
+from test_rigid_load_transfer import random_frames, random_loads
+
+CASE_NAMES = ['dead', 'live', 'wind']
+COMBINATIONS = {'ULS1': {'dead': 1.35, 'live': 1.5},
+                'ULS2': {'dead': 1.0, 'wind': 1.5},
+                'SLS': {'dead': 1.0, 'live': 1.0, 'wind': 0.6},
+                'uplift': {'dead': 0.9, 'wind': -1.5}}
+
+
+def load_cases(rng, n_loads):
+    """Three load cases on the same load frames"""
+    frames = random_loads(rng, n_loads)
+    return [[dict(frame, force=rng.normal(size=3).tolist(), moment=rng.normal(size=3).tolist()) for frame in frames]
+            for _ in CASE_NAMES]
+
+
+def factored_loads(cases, factors):
+    """One load list with the factored sum of the forces and moments of the cases"""
+    loads = []
+    for n, frame in enumerate(cases[0]):
+        force = sum(factor*np.array(case[n]['force']) for factor, case in zip(factors, cases))
+        moment = sum(factor*np.array(case[n]['moment']) for factor, case in zip(factors, cases))
+        loads.append(dict(frame, force=force.tolist(), moment=moment.tolist()))
+    return loads
+
+
+def test_resultants_match_transfer_systems(rng):
+    cases = load_cases(rng, 6)
+    targets = random_frames(rng, 4)
+    superposition = lc.LoadSuperposition(cases[0], targets)
+    wrenches = lc.stack_cases(cases)
+    assert wrenches.shape == (3, 6, 6)
+    expected = np.array([rlt.transfer_systems(case, targets) for case in cases])
+    np.testing.assert_allclose(superposition.resultants(wrenches), expected, atol=1e-12)
+    np.testing.assert_allclose(superposition.resultants(wrenches[1]), expected[1], atol=1e-12)
+
+    degrees = [dict(target, euler_angles=np.degrees(target['euler_angles']).tolist()) for target in targets]
+    loads_degrees = [dict(load, euler_angles=np.degrees(load['euler_angles']).tolist()) for load in cases[0]]
+    np.testing.assert_allclose(lc.LoadSuperposition(loads_degrees, degrees, degrees=True).resultants(wrenches),
+                               expected, atol=1e-12)
+
+
+def test_envelope_matches_per_case_combinations(rng):
+    cases = load_cases(rng, 5)
+    targets = random_frames(rng, 3)
+    factors, names = lc.factor_matrix(COMBINATIONS, CASE_NAMES)
+    np.testing.assert_array_equal(factors, [[1.35, 1.5, 0.0], [1.0, 0.0, 1.5], [1.0, 1.0, 0.6], [0.9, 0.0, -1.5]])
+    assert names.tolist() == list(COMBINATIONS)
+
+    combined = np.array([[np.concatenate(rlt.combine_loads(factored_loads(cases, row), target))
+                          for target in targets] for row in factors])
+
+    superposition = lc.LoadSuperposition(cases[0], targets)
+    wrenches = lc.stack_cases(cases)
+    np.testing.assert_allclose(superposition.combine(factors, wrenches), combined, atol=1e-12)
+
+    envelope = superposition.envelope(factors, wrenches)
+    np.testing.assert_allclose(envelope.minimum, combined.min(axis=0), atol=1e-12)
+    np.testing.assert_allclose(envelope.maximum, combined.max(axis=0), atol=1e-12)
+    np.testing.assert_array_equal(envelope.argmin, combined.argmin(axis=0))
+    np.testing.assert_array_equal(envelope.argmax, combined.argmax(axis=0))
+
+    frame = envelope.to_frame([target.get('name', f'T{m}') for m, target in enumerate(targets)], names)
+    assert len(frame) == 6*len(targets)
+    assert frame['max_combination'].tolist() == names[envelope.argmax.ravel()].tolist()
+
+
+def test_invalid_cases_and_factors(rng):
+    cases = load_cases(rng, 3)
+    with pytest.raises(ValueError):
+        lc.stack_cases([cases[0], cases[1][:2]])
+    with pytest.raises(ValueError):
+        lc.factor_matrix({'ULS': {'snow': 1.5}}, CASE_NAMES)
+    superposition = lc.LoadSuperposition(cases[0], random_frames(rng, 2))
+    with pytest.raises(ValueError):
+        superposition.resultants(np.zeros((3, 4, 6)))
+    with pytest.raises(ValueError):
+        superposition.combine(np.ones((2, 2)), lc.stack_cases(cases))
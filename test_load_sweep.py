@@ -0,0 +1,78 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Checks of the parametric sweeps against one combine_loads call per grid point
+"""
+import copy
+
+import numpy as np
+import pytest
+
+import load_sweep
+import rigid_load_transfer as rlt
+
+PARAMS = {'rz': np.arange(0, 360, 45.0), 'tx': np.linspace(-1, 1, 3), 'ry': np.array([0.0, 30.0])}
+
+
+def sweep_case(rng):
+    """Loads and target with angles in degrees"""
+    loads = [{'force': rng.normal(size=3).tolist(), 'moment': rng.normal(size=3).tolist(),
+              'euler_angles': rng.uniform(0, 360, 3).tolist(), 'rotation_order': order,
+              'translation': rng.normal(size=3).tolist()} for order in ['xyz', 'zyx', 'yxz', 'xzy']]
+    target = {'euler_angles': [10.0, 20.0, 30.0], 'rotation_order': 'zyx', 'translation': [1.0, 2.0, 3.0]}
+    return loads, target
+
+
+def brute_force(loads, target, location, frame, load_index):
+    """Resultant at one grid point: the swept frame edited in place, then combine_loads"""
+    loads, target = copy.deepcopy(loads), copy.deepcopy(target)
+    swept = target if frame == 'target' else loads[load_index]
+    for name, value in location.items():
+        field, component = load_sweep.SWEEP_PARAMETERS[name]
+        swept[field][component] = value
+    radians = [dict(load, euler_angles=np.radians(load['euler_angles']).tolist()) for load in loads]
+    force, moment = rlt.combine_loads(radians, dict(target, euler_angles=np.radians(target['euler_angles']).tolist()))
+    return np.concatenate([force, moment])
+
+
+@pytest.mark.parametrize('frame', ['target', 'load'])
+def test_sweep_matches_brute_force(rng, frame):
+    loads, target = sweep_case(rng)
+    result = load_sweep.sweep(loads, target, PARAMS, frame=frame, load_index=2, degrees=True, chunk_size=7)
+    assert result.dims == tuple(PARAMS) and result.shape == (8, 3, 2)
+    for index in np.ndindex(result.shape):
+        np.testing.assert_allclose(result.values[index],
+                                   brute_force(loads, target, result.location(index), frame, 2), atol=1e-12)
+    assert len(result.to_frame()) == result.values.size // 6
+
+
+@pytest.mark.parametrize('frame', ['target', 'load'])
+def test_sweep_extremes_match_grid(rng, frame):
+    loads, target = sweep_case(rng)
+    flat = load_sweep.sweep(loads, target, PARAMS, frame=frame, load_index=1, degrees=True).values.reshape(-1, 6)
+    columns = np.column_stack([flat, np.linalg.norm(flat[:, :3], axis=1), np.linalg.norm(flat[:, 3:], axis=1)])
+    extremes = load_sweep.sweep_extremes(loads, target, PARAMS, frame=frame, load_index=1, degrees=True,
+                                         chunk_size=5)
+    np.testing.assert_allclose(extremes.minimum, columns.min(axis=0), atol=1e-12)
+    np.testing.assert_allclose(extremes.maximum, columns.max(axis=0), atol=1e-12)
+    np.testing.assert_array_equal(extremes.argmin, columns.argmin(axis=0))
+    np.testing.assert_array_equal(extremes.argmax, columns.argmax(axis=0))
+
+    worst = extremes.governing('|F|')
+    location = {name: worst[name] for name in PARAMS}
+    assert np.isclose(worst['value'], np.linalg.norm(brute_force(loads, target, location, frame, 1)[:3]))
+    assert extremes.governing('Mz', 'min')['value'] == columns[:, 5].min()
+
+
+def test_sweep_invalid_arguments(rng):
+    loads, target = sweep_case(rng)
+    for params in [{}, {'sx': [1.0]}, {'rz': []}, {'rz': [[0.0, 1.0]]}]:
+        with pytest.raises(ValueError):
+            load_sweep.sweep(loads, target, params)
+    with pytest.raises(ValueError):
+        load_sweep.sweep(loads, target, PARAMS, frame='global')
+    with pytest.raises(ValueError):
+        load_sweep.sweep_extremes(loads, target, PARAMS).governing('Fx', 'mean')
@@ -0,0 +1,98 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Checks of the vectorized load transfer against per-load rigid_load_transfer loops
+"""
+import numpy as np
+
+import rigid_load_transfer as rlt
+
+
+def random_frames(rng, n):
+    orders = ['xyz', 'zyx', 'yzx', 'zxy']
+    return [{'euler_angles': rng.uniform(-np.pi, np.pi, 3).tolist(),
+             'rotation_order': orders[i % len(orders)],
+             'translation': rng.normal(size=3).tolist()} for i in range(n)]
+
+
+def random_loads(rng, n):
+    return [dict(frame, force=rng.normal(size=3).tolist(), moment=rng.normal(size=3).tolist())
+            for frame in random_frames(rng, n)]
+
+
+def loop_combine_loads(loads, target):
+    """combine_loads as one rigid_load_transfer call per load"""
+    R_target, target_pos = rlt.create_rotation_matrix(target['euler_angles'], target['rotation_order'],
+                                                      target['translation'])
+    total_force, total_moment = np.zeros(3), np.zeros(3)
+    for load in loads:
+        R, pos = rlt.create_rotation_matrix(load['euler_angles'], load['rotation_order'], load['translation'])
+        force, moment = rlt.rigid_load_transfer(np.array(load['force']), np.array(load['moment']), R, pos,
+                                                R_target, target_pos)
+        total_force += force
+        total_moment += moment
+    return np.concatenate([total_force, total_moment])
+
+
+def test_combine_loads_matches_loop(rng):
+    loads = random_loads(rng, 40)
+    target = random_frames(rng, 1)[0]
+    np.testing.assert_allclose(np.concatenate(rlt.combine_loads(loads, target)),
+                               loop_combine_loads(loads, target), atol=1e-12)
+
+
+def test_transfer_systems_matches_loop(rng):
+    loads = random_loads(rng, 30)
+    targets = random_frames(rng, 7)
+    resultants, contributions = rlt.transfer_systems(loads, targets, return_contributions=True)
+    expected = np.array([loop_combine_loads(loads, target) for target in targets])
+    np.testing.assert_allclose(resultants, expected, atol=1e-12)
+    np.testing.assert_allclose(rlt.transfer_systems(loads, targets), expected, atol=1e-12)
+    np.testing.assert_allclose(contributions[3, 5], loop_combine_loads(loads[5:6], targets[3]), atol=1e-12)
+
+    degrees = [dict(system, euler_angles=np.degrees(system['euler_angles']).tolist()) for system in loads]
+    targets_degrees = [dict(system, euler_angles=np.degrees(system['euler_angles']).tolist()) for system in targets]
+    np.testing.assert_allclose(rlt.transfer_systems(degrees, targets_degrees, degrees=True), expected, atol=1e-12)
+
+
+def test_missing_force_or_moment_is_zero(rng):
+    loads = random_loads(rng, 4)
+    targets = random_frames(rng, 3)
+    partial = [{key: value for key, value in load.items() if key != missing}
+               for load, missing in zip(loads, ['force', 'moment', 'force', None])]
+    for load, missing in zip(loads, ['force', 'moment', 'force']):
+        load[missing] = [0.0, 0.0, 0.0]
+    np.testing.assert_allclose(rlt.transfer_systems(partial, targets), rlt.transfer_systems(loads, targets),
+                               atol=1e-12)
+    np.testing.assert_allclose(np.concatenate(rlt.combine_loads(partial, targets[0])),
+                               loop_combine_loads(loads, targets[0]), atol=1e-12)
+
+
+def test_transfer_operators_match_contributions(rng):
+    loads = random_loads(rng, 12)
+    targets = random_frames(rng, 5)
+    _, contributions = rlt.transfer_systems(loads, targets, return_contributions=True)
+    operators = rlt.transfer_operators_systems(loads, targets)
+    wrenches = np.array([load['force'] + load['moment'] for load in loads])
+    np.testing.assert_allclose(np.einsum('mnij,nj->mni', operators, wrenches), contributions, atol=1e-12)
+
+
+def test_transfer_operator_cache_and_invalidation(rng):
+    source, target = random_frames(rng, 2)
+    op = rlt.TransferOperator(source, target)
+    history = rng.normal(size=(100, 6))
+
+    def expected():
+        return np.array([loop_combine_loads([dict(source, force=w[:3], moment=w[3:])], target) for w in history])
+
+    np.testing.assert_allclose(op.apply(history), expected(), atol=1e-12)
+    matrix = op.matrix
+    assert op.matrix is matrix
+    source['euler_angles'][0] += 0.3
+    assert op.matrix is not matrix
+    np.testing.assert_allclose(op.apply(history), expected(), atol=1e-12)
+    target['translation'] = [0.0, 1.0, 0.0]
+    np.testing.assert_allclose(op.apply(history), expected(), atol=1e-12)
@@ -0,0 +1,117 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Checks of the rlt dashboard figure patching and input panel
+"""
+import copy
+import json
+import os
+from contextvars import copy_context
+
+import plotly
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+
+import rlt
+
+LOAD_INPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'load_input.json')
+
+
+def load_case():
+    with open(LOAD_INPUT) as f:
+        data = json.load(f)
+    rlt.normalize_colors(data['loads'])
+    rlt.normalize_colors(data['targets'])
+    return data['loads'], data['targets']
+
+
+def figure_state(loads, targets, slices):
+    """figure-state data as update_visualization stores it"""
+    return dict(slices, style='systems',
+                loads=[rlt.system_hash(load) for load in loads],
+                targets=[rlt.system_hash(target) for target in targets],
+                target_positions=[target['translation'] for target in targets])
+
+
+def apply_patch(figure, patch):
+    """Applies the Assign operations of a Patch of 'data' entries to a figure dict"""
+    figure = copy.deepcopy(figure)
+    for operation in patch.to_plotly_json()['operations']:
+        assert operation['operation'] == 'Assign' and operation['location'][0] == 'data'
+        figure['data'][operation['location'][1]] = operation['params']['value']
+    return figure
+
+
+def as_json(data):
+    return json.loads(json.dumps(data, cls=plotly.utils.PlotlyJSONEncoder))
+
+
+def test_moved_target_patch_matches_rebuild():
+    loads, targets = load_case()
+    fig, slices = rlt.build_figure(loads, targets, 'default')
+    state = figure_state(loads, targets, slices)
+
+    moved = copy.deepcopy(targets)
+    moved[0]['translation'] = [9.0, 9.0, 9.0]
+    patch = rlt.patch_figure(loads, moved, state)
+    assert patch is not None
+    expected, _ = rlt.build_figure(loads, moved, 'default')
+    assert as_json(apply_patch(fig, patch)['data']) == as_json(expected['data'])
+
+
+def test_moved_target_patch_skips_load_without_traces():
+    loads, targets = load_case()
+    # A cleared rotation-order dropdown: the load draws nothing and keeps an empty slice
+    loads[1]['rotation_order'] = None
+    fig, slices = rlt.build_figure(loads, targets, 'default')
+    assert slices['load_slices'][1][1] == 0 and slices['load_connections'][1] is None
+    state = figure_state(loads, targets, slices)
+
+    moved = copy.deepcopy(targets)
+    moved[0]['translation'] = [9.0, 9.0, 9.0]
+    patch = rlt.patch_figure(loads, moved, state)
+    assert patch is not None
+    expected, _ = rlt.build_figure(loads, moved, 'default')
+    # Without explicit offsets the broken load's line overwrote load 0's connection to target 0
+    assert as_json(apply_patch(fig, patch)['data']) == as_json(expected['data'])
+
+
+def run_callback(callback, trigger, *args):
+    """Calls a callback in a callback context, returns (output, props set with set_props)"""
+    def run():
+        context_value.set(AttributeDict(triggered_inputs=[{'prop_id': trigger}], updated_props={}))
+        return callback(*args), context_value.get().updated_props
+    return copy_context().run(run)
+
+
+def find_input(component, component_id):
+    """Value of the input with component_id in a rendered panel"""
+    if isinstance(component, (list, tuple)):
+        return next((value for value in (find_input(c, component_id) for c in component) if value is not None), None)
+    if getattr(component, 'id', None) == component_id:
+        return component.value
+    children = getattr(component, 'children', None)
+    return None if children is None or isinstance(children, str) else find_input(children, component_id)
+
+
+def test_pending_edits_survive_panel_rerender():
+    loads, targets = load_case()
+    pending = {'load': {'0': {'force': [5.0, 6.0, 7.0]}, str(len(loads)): {'force': [1.0, 1.0, 1.0]}},
+               'target': {}}
+    pages = {'load': 0, 'target': 0}
+    # An added system, an upload or an edit-mode switch re-renders the panel and keeps the edits
+    for trigger, mode in [('panel-revision.data', 'apply'), ('edit-mode.value', 'live')]:
+        (load_controls, *_), props = run_callback(rlt.update_input_components, trigger,
+                                                  1, mode, pages, loads + [loads[0]], targets, pending)
+        assert find_input(load_controls, {'type': 'fy', 'index': 0, 'input-type': 'load'}) == 6.0
+        assert 'pending-edits' not in props
+    # Edits of systems that no longer exist are dropped, the others kept
+    _, props = run_callback(rlt.update_input_components, 'panel-revision.data',
+                            1, 'apply', pages, loads, targets, pending)
+    assert props['pending-edits']['data'] == {'load': {'0': {'force': [5.0, 6.0, 7.0]}}, 'target': {}}
+    # Only Discard clears them
+    _, props = run_callback(rlt.discard_edits, 'discard-edits-btn.n_clicks', 1)
+    assert props['pending-edits']['data'] == rlt.NO_EDITS
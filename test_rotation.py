@@ -0,0 +1,96 @@
+"""
+@Author:    Pramod Kumar Yadav
+@email:     pkyadav01234@gmail.com
+@Date:      October, 2026
+@status:    development
+@PythonVersion: python3
+@Function:  Checks of the shared rotation core against single-axis matrix products
+"""
+import numpy as np
+import pytest
+
+import rigid_load_transfer as rlt
+from rotation import EULER_SEQUENCES, QuaternionArray, dcm_to_euler, euler_to_dcm
+
+ALL_SEQUENCES = EULER_SEQUENCES + tuple(sequence.lower() for sequence in EULER_SEQUENCES)
+
+
+@pytest.mark.parametrize('sequence', ALL_SEQUENCES)
+def test_dcm_to_euler_round_trip(sequence, rng):
+    angles = rng.uniform(-np.pi, np.pi, (200, 3))
+    R = euler_to_dcm(angles, sequence)
+    np.testing.assert_allclose(euler_to_dcm(dcm_to_euler(R, sequence), sequence), R, atol=1e-10)
+
+
+@pytest.mark.parametrize('sequence', ALL_SEQUENCES)
+def test_dcm_to_euler_gimbal_lock(sequence, rng):
+    proper = sequence[0].lower() == sequence[2].lower()
+    angles = rng.uniform(-np.pi, np.pi, (4, 3))
+    angles[:, 1] = [0.0, np.pi, 0.0, np.pi] if proper else [np.pi/2, -np.pi/2, np.pi/2, -np.pi/2]
+    R = euler_to_dcm(angles, sequence)
+    result = dcm_to_euler(R, sequence)
+    np.testing.assert_allclose(euler_to_dcm(result, sequence), R, atol=1e-10)
+    # The third intrinsic angle is zeroed: the last angle of an intrinsic sequence, the first of an extrinsic one
+    np.testing.assert_allclose(result[:, 2 if sequence.isupper() else 0], 0.0, atol=1e-12)
+
+
+def test_dcm_to_euler_invalid_sequence():
+    with pytest.raises(ValueError):
+        dcm_to_euler(np.eye(3), 'XXY')
+
+
+@pytest.mark.parametrize('sequence', ALL_SEQUENCES)
+def test_quaternion_from_euler_matches_dcm(sequence, rng):
+    angles = rng.uniform(-np.pi, np.pi, (50, 3))
+    np.testing.assert_allclose(QuaternionArray.from_euler(angles, sequence).to_dcm(),
+                               euler_to_dcm(angles, sequence), atol=1e-12)
+
+
+def test_quaternion_round_trips(rng):
+    q = QuaternionArray(rng.normal(size=(500, 4))).normalized()
+    R = q.to_dcm()
+    back = QuaternionArray.from_dcm(R)
+    # q and -q are the same rotation
+    np.testing.assert_allclose(np.abs(np.sum(back.q*q.q, axis=1)), 1.0, atol=1e-12)
+    np.testing.assert_allclose(QuaternionArray.from_euler(q.to_euler('ZYX'), 'ZYX').to_dcm(), R, atol=1e-10)
+
+    p = QuaternionArray(rng.normal(size=(500, 4))).normalized()
+    np.testing.assert_allclose((p*q).to_dcm(), p.to_dcm() @ R, atol=1e-12)
+    np.testing.assert_allclose((q*q.inv()).to_dcm(), np.broadcast_to(np.eye(3), R.shape), atol=1e-12)
+
+    vectors = rng.normal(size=(500, 3))
+    np.testing.assert_allclose(q.apply(vectors), np.einsum('nij,nj->ni', R, vectors), atol=1e-12)
+    np.testing.assert_allclose(q[0].apply(vectors), vectors @ R[0].T, atol=1e-12)
+
+
+def reference_dcm(angles, sequence):
+    """Product of _axis_rotation matrices: intrinsic R1 R2 R3, extrinsic R3 R2 R1"""
+    axes = sequence.lower()
+    R = np.eye(3)
+    factors = [rlt._axis_rotation(axis, angle) for axis, angle in zip(axes, angles)]
+    for factor in (factors if sequence.isupper() else reversed(factors)):
+        R = R @ factor
+    return R
+
+
+@pytest.mark.parametrize('sequence', ALL_SEQUENCES)
+def test_euler_to_dcm_matches_axis_products(sequence, rng):
+    angles = rng.uniform(-np.pi, np.pi, (50, 3))
+    expected = np.array([reference_dcm(a, sequence) for a in angles])
+    np.testing.assert_allclose(euler_to_dcm(angles, sequence), expected, atol=1e-12)
+    np.testing.assert_allclose(euler_to_dcm(angles[0], sequence), expected[0], atol=1e-12)
+
+
+def test_create_rotation_matrix_matches_baseline_loop(rng):
+    # The original create_rotation_matrix multiplied the axis matrices in reversed order
+    for order in ['xyz', 'zyx', 'yxz', 'XZY']:
+        angles = rng.uniform(-np.pi, np.pi, 3)
+        R = np.eye(3)
+        for axis in reversed(order.lower()):
+            R = R @ rlt._axis_rotation(axis, angles[order.lower().index(axis)])
+        np.testing.assert_allclose(rlt.create_rotation_matrix(angles, order, [0, 0, 0])[0], R, atol=1e-12)
+
+
+def test_euler_to_dcm_invalid_sequence():
+    with pytest.raises(ValueError):
+        euler_to_dcm([0, 0, 0], 'xYz')